@@ -4,11 +4,17 @@ Common functionality for all agents with self-deployment and reactive behavior.
 """
 
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Optional, Dict
+import os
+from typing import Any, Optional, Dict, Tuple
 from coordination.message_bus import MessageBus
 from coordination.agent_registry import AgentRegistry, AgentRole, AgentCapability, RegisteredAgent
 from coordination.role_policy import RolePolicyEngine, ActionType, PolicyViolation
+from coordination.clock import now_iso
+
+# Documents shorter than this (after stripping) are analyzed in small-context mode
+SMALL_CONTEXT_CHARS = 500
+# Leading slice of the document quoted in per-factor prompts
+DOCUMENT_EXCERPT_CHARS = 2000
 
 
 class BaseAgent(ABC):
@@ -39,6 +45,8 @@ class BaseAgent(ABC):
         self.llm_client = llm_client
         self.registry = registry
         self.policy_engine = policy_engine
+        # (input_text, excerpt, is_small_context) for the session document
+        self._document_view = None
         
         # Register this agent
         if registry:
@@ -102,9 +110,41 @@ class BaseAgent(ABC):
         message['agent_id'] = self.agent_id
         await self.message_bus.publish(message, agent_id=self.agent_id)
     
+    def _document_context(self, input_text: str) -> Tuple[str, bool]:
+        """
+        Prompt excerpt and small-context flag for the session document.
+        The document is fixed for a session, so this is computed once rather than per factor.
+        """
+        cached = self._document_view
+        if cached is not None and cached[0] is input_text:
+            return cached[1], cached[2]
+        excerpt = input_text[:DOCUMENT_EXCERPT_CHARS]
+        is_small_context = len(input_text.strip()) < SMALL_CONTEXT_CHARS
+        self._document_view = (input_text, excerpt, is_small_context)
+        return excerpt, is_small_context
+    
+    @staticmethod
+    def _find_json(text: str, open_char: str = '[', close_char: str = ']') -> Optional[str]:
+        """
+        Return the span from the first open_char to the last close_char, or None.
+        Same span as re.search(r'\[.*\]', text, re.DOTALL), located with two string scans.
+        """
+        start = text.find(open_char)
+        if start == -1:
+            return None
+        end = text.rfind(close_char)
+        if end < start:
+            return None
+        return text[start:end + 1]
+    
+    @staticmethod
+    def _new_id_suffix() -> str:
+        """Random 64-bit hex suffix for claim IDs (no timestamp formatting or UUID object)."""
+        return os.urandom(8).hex()
+    
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        return datetime.utcnow().isoformat()
+        return now_iso()
     
     async def process(self, *args, **kwargs) -> Any:
         """
@@ -5,11 +5,20 @@ Reactive: automatically responds to support arguments.
 """
 
 from typing import Dict, Set
+import re
 from .base_agent import BaseAgent
 from coordination.message_bus import MessageBus, MessageType
 from coordination.agent_registry import AgentRegistry, AgentRole
 from coordination.role_policy import RolePolicyEngine
 from coordination.claims import Claim, ClaimStatus, EvidenceStrength
+from validation.resolution_tracker import ResolutionStatus
+
+# Critique resolutions -> tracker statuses
+_RESOLUTION_STATUSES = {
+    "ACCEPTED": ResolutionStatus.ACCEPTED,
+    "PARTIALLY_ACCEPTED": ResolutionStatus.PARTIALLY_ACCEPTED,
+    "REJECTED": ResolutionStatus.REJECTED
+}
 
 
 class CriticAgent(BaseAgent):
@@ -65,7 +74,7 @@ class CriticAgent(BaseAgent):
         if not factor:
             return
         
-        input_text = self.current_input_text or message.get('input_text_preview', '')
+        input_text = self.current_input_text
         
         # Generate critique
         await self.critique_factor(factor, message, input_text)
@@ -79,8 +88,7 @@ class CriticAgent(BaseAgent):
         self.current_input_text = input_text
         
         # Detect context size for mode selection
-        context_size = len(input_text.strip())
-        is_small_context = context_size < 500
+        document_excerpt, is_small_context = self._document_context(input_text)
         
         # Extract supporting agent's claim if available
         support_claim_data = support_argument.get('claim')
@@ -93,18 +101,15 @@ class CriticAgent(BaseAgent):
         
         # Check if supporting agent conceded in any rebuttal
         has_concession = False
-        all_messages = self.message_bus.get_all_messages()
-        for msg in all_messages:
-            if (msg.get('type') == MessageType.REBUTTAL.value and 
-                msg.get('factor_id') == factor['id'] and
+        # Rebuttals come straight from the bus's type index rather than a scan of every message
+        rebuttals = self.message_bus.get_messages_by_type(MessageType.REBUTTAL)
+        for msg in rebuttals:
+            if (msg.get('factor_id') == factor['id'] and
                 msg.get('is_concession', False)):
                 has_concession = True
                 break
         
         # Check if this is a simple descriptive fact (before LLM call)
-        context_size = len(input_text.strip())
-        is_small_context = context_size < 500
-        
         factor_desc = factor.get('description', '').lower()
         factor_name = factor.get('name', '').lower()
         
@@ -127,7 +132,9 @@ class CriticAgent(BaseAgent):
 - Do NOT use external knowledge or assumptions
 - Every critique must reference document content
 - CRITICAL: Do NOT hallucinate or add information not in the document"""
-        
+
+        # Instructions and document come before the factor-specific sections so critiques
+        # of sibling factors share a common prompt prefix (provider prompt caching)
         prompt = f"""You are the Critic Agent inside Project AETHER. Your role is to stress-test each factor and, when appropriate, reject it outright.
 
 {mode_instruction}
@@ -169,6 +176,9 @@ SUB-CLAIMS:
 For ACCEPTED (DESCRIPTIVE ONLY):
 - State: "This factor describes what happened but does NOT establish causality"
 
+Original Document Context:
+{document_excerpt}
+
 Factor:
 ID: {factor['id']}
 Name: {factor['name']}
@@ -179,9 +189,6 @@ Supporting Agent's Argument:
 {support_argument.get('argument', 'No argument provided')}
 Evidence Provided: {'NO - MUST REJECT' if not has_evidence else 'YES'}
 
-Original Document Context:
-{input_text[:2000]}
-
 Provide a critical analysis that:
 1. Identifies specific flaws or weaknesses in the factor
 2. Points out risks, harms, or negative consequences of accepting this factor
@@ -222,7 +229,6 @@ Remember: You MUST end with the RESOLUTION section in the exact format specified
                 justification = "Factor failed validation"
         else:
             # Parse resolution from response
-            import re
             resolution_match = re.search(r'RESOLUTION:\s*(ACCEPTED(?:\s*\(DESCRIPTIVE ONLY\))?|PARTIALLY_ACCEPTED|REJECTED)', response, re.IGNORECASE)
             justification_match = re.search(r'JUSTIFICATION:\s*(.+?)(?:SUB-CLAIMS:|$)', response, re.DOTALL | re.IGNORECASE)
             
@@ -254,9 +260,8 @@ Remember: You MUST end with the RESOLUTION section in the exact format specified
             if "CAUSAL" in response.upper() or "CAUSALITY" in response.upper():
                 # Check if there's a rebuttal
                 rebuttal_msg = None
-                for msg in all_messages:
-                    if (msg.get('type') == MessageType.REBUTTAL.value and 
-                        msg.get('factor_id') == factor['id']):
+                for msg in rebuttals:
+                    if msg.get('factor_id') == factor['id']:
                         rebuttal_msg = msg
                         break
                 
@@ -298,15 +303,9 @@ Remember: You MUST end with the RESOLUTION section in the exact format specified
         
         # Track resolution
         if self.resolution_tracker:
-            from validation.resolution_tracker import ResolutionStatus
-            status_map = {
-                "ACCEPTED": ResolutionStatus.ACCEPTED,
-                "PARTIALLY_ACCEPTED": ResolutionStatus.PARTIALLY_ACCEPTED,
-                "REJECTED": ResolutionStatus.REJECTED
-            }
             self.resolution_tracker.set_resolution(
                 factor_id=factor['id'],
-                status=status_map[resolution_str],
+                status=_RESOLUTION_STATUSES[resolution_str],
                 justification=justification,
                 sub_claims=sub_claims if sub_claims else None,
                 critic_agent_id=self.agent_id
@@ -315,7 +314,7 @@ Remember: You MUST end with the RESOLUTION section in the exact format specified
         # Create structured claim
         factor_id = factor['id']
         claim = Claim(
-            claim_id=f"critique_{factor_id}_{self._get_timestamp()}",
+            claim_id=f"critique_{factor_id}_{self._new_id_suffix()}",
             content=response,
             factor_id=factor_id,
             agent_id=self.agent_id
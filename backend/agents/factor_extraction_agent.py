@@ -5,6 +5,8 @@ Self-deploys and reacts to analysis requests.
 """
 
 from typing import List, Dict, Set
+import re
+import orjson
 from .base_agent import BaseAgent
 from coordination.message_bus import MessageBus, MessageType
 from coordination.agent_registry import AgentRegistry, AgentRole
@@ -96,13 +98,12 @@ Output JSON:
         if self.factor_validator:
             validation_results = self.factor_validator.validate_factor_list(factors, input_text)
             
-            # Add validation metadata to each factor
+            # Add validation metadata to each factor (index validations once, first match wins)
+            validations_by_id = {}
+            for v in validation_results['factor_validations']:
+                validations_by_id.setdefault(v['factor_id'], v)
             for factor in factors:
-                factor_id = factor['id']
-                validation = next(
-                    (v for v in validation_results['factor_validations'] if v['factor_id'] == factor_id),
-                    None
-                )
+                validation = validations_by_id.get(factor['id'])
                 if validation:
                     factor['validation'] = {
                         'is_grounded': validation['is_grounded'],
@@ -113,11 +114,12 @@ Output JSON:
                     }
         
         # CRITICAL: Validate quotes exist in document
+        input_text_lower = input_text.lower()
         for factor in factors:
             quote = factor.get('quote', '')
             if quote:
                 # Check if quote actually appears in document
-                if quote.lower() not in input_text.lower():
+                if quote.lower() not in input_text_lower:
                     # Mark as invalid - hallucinated quote
                     if 'validation' not in factor:
                         factor['validation'] = {}
@@ -146,14 +148,12 @@ Output JSON:
     
     def _parse_factors(self, response: str) -> List[Dict]:
         """Parse LLM response into structured factor list."""
-        import json
-        import re
         
         # Try to extract JSON from response
-        json_match = re.search(r'\[.*\]', response, re.DOTALL)
-        if json_match:
+        json_text = self._find_json(response, '[', ']')
+        if json_text:
             try:
-                factors = json.loads(json_match.group())
+                factors = orjson.loads(json_text)
                 # Ensure all factors have required fields
                 for i, factor in enumerate(factors, 1):
                     if "id" not in factor:
@@ -163,7 +163,7 @@ Output JSON:
                     if "description" not in factor:
                         factor["description"] = "No description provided"
                 return factors
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
         
         # Fallback: parse numbered list
@@ -4,12 +4,18 @@ Produces ONE unified, structured final report with decisive verdicts.
 """
 
 from typing import Dict, Set, List
+import asyncio
 from .base_agent import BaseAgent
 from coordination.message_bus import MessageBus, MessageType
 from coordination.agent_registry import AgentRegistry, AgentRole
 from coordination.role_policy import RolePolicyEngine
-import json
-import re
+import orjson
+
+
+# Message type values compared inside the per-message loops below
+_SUPPORT_ARGUMENT = MessageType.SUPPORT_ARGUMENT.value
+_CRITIQUE = MessageType.CRITIQUE.value
+_REBUTTAL = MessageType.REBUTTAL.value
 
 
 class FinalDecisionAgent(BaseAgent):
@@ -42,13 +48,8 @@ class FinalDecisionAgent(BaseAgent):
         return "Generates final decisive report with structured verdict and confidence scoring"
     
     def _setup_subscriptions(self):
-        """Subscribe to synthesis completion."""
-        self.message_bus.subscribe(MessageType.SYNTHESIS_NOTE.value, self._on_synthesis_complete)
-    
-    async def _on_synthesis_complete(self, message: Dict):
-        """React to synthesis - generate final report automatically."""
-        # This could be auto-triggered, but for now we'll keep manual trigger
-        # to ensure orchestrator controls timing
+        """No subscriptions - the orchestrator triggers the final report after synthesis."""
+        # Subscribing a no-op handler to SYNTHESIS_NOTE would only wake this agent for nothing
         pass
     
     async def generate_final_report(self, input_text: str) -> Dict:
@@ -57,12 +58,9 @@ class FinalDecisionAgent(BaseAgent):
         # Collect all information
         factors = self.message_bus.get_factors()
         all_messages = self.message_bus.get_all_messages()
-        synthesis = None
-        
-        for msg in all_messages:
-            if msg['type'] == MessageType.SYNTHESIS_NOTE.value:
-                synthesis = msg
-                break
+        # First synthesis note, straight from the bus's type index
+        synthesis_notes = self.message_bus.get_messages_by_type(MessageType.SYNTHESIS_NOTE)
+        synthesis = synthesis_notes[0] if synthesis_notes else None
         
         # Build comprehensive debate log per factor
         debate_log = self._build_debate_log(factors, all_messages)
@@ -77,7 +75,6 @@ class FinalDecisionAgent(BaseAgent):
         ])
         
         synthesis_text = synthesis.get('synthesis', 'No synthesis available') if synthesis else "No synthesis available"
-        structured_synthesis = synthesis.get('structured', {}) if synthesis else {}
         
         prompt = f"""You are the Final Decision Agent inside Project AETHER. You are the ONLY agent allowed to generate the final answer.
 
@@ -246,10 +243,11 @@ Factor 2:
 
 Generate the complete report following this EXACT format. Include ALL factors in the debate log. Do NOT skip any section."""
 
-        response = await self.llm_client.generate(prompt)
-        
-        # Generate self-check section with actual data (async)
-        self_check_data = await self._generate_self_check(factors, debate_log, all_messages, input_text)
+        # The report and the self-check (assumption detection) are independent LLM calls - run them together
+        response, self_check_data = await asyncio.gather(
+            self.llm_client.generate(prompt),
+            self._generate_self_check(factors, debate_log, input_text)
+        )
         self_check_text = self._format_self_check(self_check_data)
         
         # Append self-check to response if not already included
@@ -308,6 +306,12 @@ Generate the complete report following this EXACT format. Include ALL factors in
         debate_log = {}
         rejected_factors = set()
         
+        # Index the first critique per factor in one pass (instead of rescanning per rebuttal)
+        first_critiques = {}
+        for msg in all_messages:
+            if msg.get('type') == _CRITIQUE:
+                first_critiques.setdefault(msg.get('factor_id'), msg)
+        
         for factor in factors:
             factor_id = factor['id']
             debate_log[factor_id] = {
@@ -326,9 +330,9 @@ Generate the complete report following this EXACT format. Include ALL factors in
                 continue
             
             msg_type = msg.get('type')
-            if msg_type == MessageType.SUPPORT_ARGUMENT.value:
+            if msg_type == _SUPPORT_ARGUMENT:
                 debate_log[factor_id]['support'] = msg.get('argument', '')
-            elif msg_type == MessageType.CRITIQUE.value:
+            elif msg_type == _CRITIQUE:
                 debate_log[factor_id]['critique'] = msg.get('argument', '')
                 # Check verdict from critique - REJECTED takes precedence
                 verdict = msg.get('verdict', '').upper()
@@ -338,7 +342,7 @@ Generate the complete report following this EXACT format. Include ALL factors in
                     rejected_factors.add(factor_id)
                 elif 'WEAKENED' in verdict and debate_log[factor_id]['resolution'] != 'REJECTED':
                     debate_log[factor_id]['resolution'] = 'WEAKENED'
-            elif msg_type == MessageType.REBUTTAL.value:
+            elif msg_type == _REBUTTAL:
                 debate_log[factor_id]['rebuttal'] = msg.get('rebuttal', '')
                 # Check if rebuttal was a concession
                 if msg.get('is_concession', False):
@@ -352,10 +356,9 @@ Generate the complete report following this EXACT format. Include ALL factors in
                     # Only partially accept if critic didn't reject
                     if debate_log[factor_id]['critique']:
                         verdict = None
-                        for m in all_messages:
-                            if m.get('factor_id') == factor_id and m.get('type') == MessageType.CRITIQUE.value:
-                                verdict = m.get('verdict', '').upper()
-                                break
+                        first_critique = first_critiques.get(factor_id)
+                        if first_critique is not None:
+                            verdict = first_critique.get('verdict', '').upper()
                         if verdict and 'REJECTED' not in verdict:
                             debate_log[factor_id]['resolution'] = 'PARTIALLY_ACCEPTED'
         
@@ -383,6 +386,12 @@ Generate the complete report following this EXACT format. Include ALL factors in
             "partially_accepted": []
         }
         
+        # Index the first rejecting critique per factor in one pass
+        rejecting_critiques = {}
+        for msg in all_messages:
+            if msg.get('type') == _CRITIQUE and 'REJECTED' in msg.get('verdict', '').upper():
+                rejecting_critiques.setdefault(msg.get('factor_id'), msg)
+        
         for factor in factors:
             factor_id = factor['id']
             log = debate_log.get(factor_id, {})
@@ -397,11 +406,9 @@ Generate the complete report following this EXACT format. Include ALL factors in
             
             # Find rejection reason from critique
             rejection_reason = None
-            for msg in all_messages:
-                if msg.get('factor_id') == factor_id and msg.get('type') == MessageType.CRITIQUE.value:
-                    if 'REJECTED' in msg.get('verdict', '').upper():
-                        rejection_reason = msg.get('rejection_reason') or msg.get('argument', '')[:300]
-                        break
+            msg = rejecting_critiques.get(factor_id)
+            if msg is not None:
+                rejection_reason = msg.get('rejection_reason') or msg.get('argument', '')[:300]
             
             if is_rejected or resolution == 'REJECTED':
                 factor_info["reason"] = f"REJECTED: {rejection_reason or log.get('critique', 'No critique available')[:200]}"
@@ -495,7 +502,7 @@ Generate the complete report following this EXACT format. Include ALL factors in
         
         return "\n".join(lines) if lines else "No failed/weak/rejected factors identified."
     
-    async def _generate_self_check(self, factors: list, debate_log: Dict, all_messages: list, input_text: str) -> Dict:
+    async def _generate_self_check(self, factors: list, debate_log: Dict, input_text: str) -> Dict:
         """Generate self-check answers with real assumption detection."""
         # Check if any factor bypassed debate
         factors_bypassed = []
@@ -559,11 +566,9 @@ If no unstated assumptions are found, return an empty array: []"""
 
         try:
             response = await self.llm_client.generate(prompt)
-            import json
-            import re
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
-            if json_match:
-                assumptions = json.loads(json_match.group())
+            json_text = self._find_json(response, '[', ']')
+            if json_text:
+                assumptions = orjson.loads(json_text)
                 return assumptions if isinstance(assumptions, list) else []
         except:
             pass
@@ -573,11 +578,11 @@ If no unstated assumptions are found, return an empty array: []"""
     def _parse_structured_report(self, response: str) -> Dict:
         """Parse structured JSON from LLM response."""
         # Try to extract JSON
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
+        json_text = self._find_json(response, '{', '}')
+        if json_text:
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
+                return orjson.loads(json_text)
+            except orjson.JSONDecodeError:
                 pass
         
         # Fallback: return minimal structure with default verdict
@@ -5,6 +5,7 @@ Reactive: automatically responds to factor discoveries and critiques.
 """
 
 from typing import Dict, Set
+import re
 from .base_agent import BaseAgent
 from coordination.message_bus import MessageBus, MessageType
 from coordination.agent_registry import AgentRegistry, AgentRole
@@ -38,6 +39,8 @@ class SupportingAgent(BaseAgent):
         self.current_input_text: str = ""
         self.assumption_tracker = assumption_tracker
         self.resolution_tracker = resolution_tracker
+        # (input_text, prompt prefix) for the current session's support prompts
+        self._support_prefix = None
     
     def _get_input_types(self) -> Set[str]:
         return {MessageType.FACTOR_DISCOVERED.value, MessageType.CRITIQUE.value}
@@ -70,8 +73,8 @@ class SupportingAgent(BaseAgent):
         if not factor_id:
             return
         
-        # Get input text from context (stored by orchestrator or factor agent)
-        input_text = self.current_input_text or message.get('input_text_preview', '')
+        # Input text is set on every agent by the orchestrator before anything is published
+        input_text = self.current_input_text
         
         # Generate support
         await self.support_factor(factor, input_text)
@@ -91,18 +94,23 @@ class SupportingAgent(BaseAgent):
             return  # No claim to defend
         
         # Get input text
-        input_text = self.current_input_text or message.get('input_text_preview', '')
+        input_text = self.current_input_text
         
         # Generate rebuttal (can issue multiple rebuttals)
         await self.rebut(factor_id, message, input_text)
     
-    async def support_factor(self, factor: Dict, input_text: str) -> Dict:
-        """Generate supporting arguments for a factor. Creates a structured Claim."""
-        self.current_input_text = input_text
+    def _support_prompt_prefix(self, input_text: str) -> str:
+        """
+        Instructions and document context shared by every factor's support prompt.
+        Built once per input text; sibling factors send an identical prefix, which
+        providers with prompt caching can reuse instead of re-processing it per factor.
+        """
+        cached = self._support_prefix
+        if cached is not None and cached[0] is input_text:
+            return cached[1]
         
         # Detect context size for mode selection
-        context_size = len(input_text.strip())
-        is_small_context = context_size < 500
+        document_excerpt, is_small_context = self._document_context(input_text)
         
         # Build context-aware prompt
         if is_small_context:
@@ -119,8 +127,8 @@ class SupportingAgent(BaseAgent):
 - Do NOT use external knowledge or assumptions
 - Every claim must be backed by document quotes
 - CRITICAL: Do NOT hallucinate or add information not in the document"""
-        
-        prompt = f"""You are the Supporting Agent inside Project AETHER.
+
+        prefix = f"""You are the Supporting Agent inside Project AETHER.
 
 {mode_instruction}
 Your role is to explore how and why a factor might appear compelling, but you are NOT allowed to legitimize historically false, genocidal, or extremist claims.
@@ -141,14 +149,23 @@ STRICT RULES:
 - You may defend only the mechanism (how belief forms or why someone might rely on this factor), NOT the truth, morality, or legitimacy of any claim that involves crimes against humanity or clearly falsified history.
 - If the factor is an "Analytically Rejected Factor", focus solely on explaining how someone could be persuaded by it (misinformation channels, ideology, cognitive bias), while explicitly stating that the underlying claim remains invalid.
 
+Original Document Context:
+{document_excerpt}
+"""
+        self._support_prefix = (input_text, prefix)
+        return prefix
+    
+    async def support_factor(self, factor: Dict, input_text: str) -> Dict:
+        """Generate supporting arguments for a factor. Creates a structured Claim."""
+        self.current_input_text = input_text
+        
+        # Shared instructions + document first, factor-specific part last
+        prompt = self._support_prompt_prefix(input_text) + f"""
 Factor:
 ID: {factor['id']}
 Name: {factor['name']}
 Description: {factor['description']}
 
-Original Document Context:
-{input_text[:2000]}
-
 Provide a strong, evidence-based analysis in this EXACT format:
 
 EVIDENCE FROM DOCUMENT:
@@ -178,7 +195,7 @@ INSUFFICIENT_EVIDENCE: [Explanation of why evidence is lacking]
             # Track this as a weak claim
             factor_id = factor['id']
             claim = Claim(
-                claim_id=f"support_{factor_id}_{self._get_timestamp()}",
+                claim_id=f"support_{factor_id}_{self._new_id_suffix()}",
                 content=response,
                 factor_id=factor_id,
                 agent_id=self.agent_id
@@ -201,7 +218,6 @@ INSUFFICIENT_EVIDENCE: [Explanation of why evidence is lacking]
             return argument
         
         # Extract assumptions from response
-        import re
         assumptions_match = re.search(r'ASSUMPTIONS:(.*?)(?:ANALYSIS:|$)', response, re.DOTALL)
         if assumptions_match and self.assumption_tracker:
             assumptions_text = assumptions_match.group(1).strip()
@@ -225,7 +241,7 @@ INSUFFICIENT_EVIDENCE: [Explanation of why evidence is lacking]
         # Create structured claim
         factor_id = factor['id']
         claim = Claim(
-            claim_id=f"support_{factor_id}_{self._get_timestamp()}",
+            claim_id=f"support_{factor_id}_{self._new_id_suffix()}",
             content=response,
             factor_id=factor_id,
             agent_id=self.agent_id
@@ -259,6 +275,7 @@ INSUFFICIENT_EVIDENCE: [Explanation of why evidence is lacking]
             return None  # No claim to defend
         
         claim = self.claims[factor_id]
+        document_excerpt, _ = self._document_context(input_text)
         
         prompt = f"""You are the Supporting Agent inside Project AETHER. You have been challenged by the Critic Agent.
 
@@ -282,7 +299,7 @@ Critic's Challenge:
 {critique.get('argument', '')}
 
 Original Document:
-{input_text[:2000]}
+{document_excerpt}
 
 Provide your rebuttal in this format:
 
@@ -7,10 +7,83 @@ Produces structured synthesis with mandatory What Worked/Failed sections.
 from typing import List, Dict, Set
 from .base_agent import BaseAgent
 from coordination.message_bus import MessageBus, MessageType
+from coordination.clock import Timestamp
 from coordination.agent_registry import AgentRegistry, AgentRole
 from coordination.role_policy import RolePolicyEngine
-import json
-import re
+import orjson
+
+
+# Message type values compared inside the per-message loop in synthesize()
+_SUPPORT_ARGUMENT = MessageType.SUPPORT_ARGUMENT.value
+_CRITIQUE = MessageType.CRITIQUE.value
+_REBUTTAL = MessageType.REBUTTAL.value
+
+
+def _trunc(text: str, limit: int = 500) -> str:
+    """Truncate text to limit chars, skipping the copy when it already fits."""
+    return text if len(text) <= limit else text[:limit]
+
+
+# Mandatory structured-synthesis sections and their empty defaults
+_EMPTY_STRUCTURED = {
+    "what_worked": [],
+    "what_failed": [],
+    "analytically_rejected": [],
+    "debate_highlights": [],
+    "per_factor_confidence": {},
+    "root_causes": []
+}
+
+
+# Static parts of the structured synthesis prompt; only the document excerpt
+# and the debate summary vary per call
+_SYNTHESIS_PROMPT_HEAD = """You are the Synthesizer Agent inside Project AETHER. Review all the structured debates below and extract key insights WITHOUT introducing false balance.
+
+Meta-goal: Project AETHER is not a consensus engine. It is a truth-seeking, failure-detecting analytical system.
+
+Original Document:
+"""
+
+_SYNTHESIS_PROMPT_MID = """
+
+Debate Summary:
+"""
+
+_SYNTHESIS_PROMPT_TAIL = """
+
+You MUST provide a structured synthesis in JSON format with the following EXACT structure:
+
+{
+  "what_worked": [
+    {"factor_id": <id>, "factor_name": "<name>", "reason": "<why it worked>", "confidence": <0.0-1.0>},
+    ...
+  ],
+  "what_failed": [
+    {"factor_id": <id>, "factor_name": "<name>", "reason": "<why it failed>", "confidence": <0.0-1.0>},
+    ...
+  ],
+  "analytically_rejected": [
+    {"factor_id": <id>, "factor_name": "<name>", "rejection_reason": "<why rejected>", "confidence": 1.0},
+    ...
+  ],
+  "debate_highlights": [
+    {"factor_id": <id>, "highlight_type": "strong_claim|concession|deadlock|breakthrough", "description": "<what happened>"},
+    ...
+  ],
+  "per_factor_confidence": {
+    "<factor_id>": <0.0-1.0>,
+    ...
+  },
+  "root_causes": [
+    "<root cause 1>",
+    "<root cause 2>",
+    ...
+  ],
+  "narrative_summary": "<overall synthesis text>"
+}
+
+Explicitly note any "Analytically Rejected Factors" and summarize why they fail factual and ethical scrutiny.
+Avoid phrases like "both sides have merit" when evidence clearly supports one conclusion."""
 
 
 class SynthesizerAgent(BaseAgent):
@@ -53,31 +126,30 @@ class SynthesizerAgent(BaseAgent):
         pass
     
     async def synthesize(self, input_text: str) -> Dict:
-        """Review all debate messages and produce synthesis notes."""
+        """Review all debate messages and produce synthesis notes (once per session)."""
+        # Repeat triggers within a session reuse the published note instead of re-running the LLM
+        if self.synthesis_triggered:
+            notes = self.message_bus.get_messages_by_type(MessageType.SYNTHESIS_NOTE)
+            if notes:
+                return notes[-1]
         
         # Get all messages from the coordination layer
         all_messages = self.message_bus.get_all_messages()
         
-        # Organize messages by factor
+        # Organize messages by factor (one dict per debate slot, keyed by factor ID)
         factors = self.message_bus.get_factors()
-        factor_debates = {}
-        
-        for factor in factors:
-            factor_id = factor['id']
-            factor_debates[factor_id] = {
-                "factor": factor,
-                "support": None,
-                "critique": None,
-                "rebuttal": None
-            }
+        factors_by_id = {factor['id']: factor for factor in factors}
+        support_by_fid = {}
+        critique_by_fid = {}
+        rebuttal_by_fid = {}
         
         for msg in all_messages:
-            if msg['type'] == MessageType.SUPPORT_ARGUMENT.value:
-                factor_debates[msg['factor_id']]['support'] = msg
-            elif msg['type'] == MessageType.CRITIQUE.value:
-                factor_debates[msg['factor_id']]['critique'] = msg
-            elif msg['type'] == MessageType.REBUTTAL.value:
-                factor_debates[msg['factor_id']]['rebuttal'] = msg
+            if msg['type'] == _SUPPORT_ARGUMENT:
+                support_by_fid[msg['factor_id']] = msg
+            elif msg['type'] == _CRITIQUE:
+                critique_by_fid[msg['factor_id']] = msg
+            elif msg['type'] == _REBUTTAL:
+                rebuttal_by_fid[msg['factor_id']] = msg
         
         # Filter factors by resolution status
         rejected_factor_ids = set()
@@ -93,15 +165,19 @@ class SynthesizerAgent(BaseAgent):
         debates_text = ""
         rejected_debates_text = ""
         
-        for factor_id, debate in factor_debates.items():
-            debate_summary = f"\n\nFactor {factor_id}: {debate['factor']['name']}\n"
-            if debate['support']:
-                debate_summary += f"SUPPORT: {debate['support']['argument'][:500]}\n"
-            if debate['critique']:
-                debate_summary += f"CRITIQUE: {debate['critique']['argument'][:500]}\n"
-                debate_summary += f"RESOLUTION: {debate['critique'].get('resolution', 'UNKNOWN')}\n"
-            if debate['rebuttal']:
-                debate_summary += f"REBUTTAL: {debate['rebuttal']['rebuttal'][:500]}\n"
+        for factor_id, factor in factors_by_id.items():
+            support = support_by_fid.get(factor_id)
+            critique = critique_by_fid.get(factor_id)
+            rebuttal = rebuttal_by_fid.get(factor_id)
+            
+            debate_summary = f"\n\nFactor {factor_id}: {factor['name']}\n"
+            if support:
+                debate_summary += f"SUPPORT: {_trunc(support['argument'])}\n"
+            if critique:
+                debate_summary += f"CRITIQUE: {_trunc(critique['argument'])}\n"
+                debate_summary += f"RESOLUTION: {critique.get('resolution', 'UNKNOWN')}\n"
+            if rebuttal:
+                debate_summary += f"REBUTTAL: {_trunc(rebuttal['rebuttal'])}\n"
             
             # Separate rejected factors
             if factor_id in rejected_factor_ids:
@@ -109,70 +185,12 @@ class SynthesizerAgent(BaseAgent):
             else:
                 debates_text += debate_summary
         
-        prompt = f"""You are the Synthesizer Agent inside Project AETHER. Review all the structured debates below and extract key insights WITHOUT introducing false balance.
-
-Meta-goal: Project AETHER is not a consensus engine. It is a truth-seeking, failure-detecting analytical system.
-
-Original Document:
-{input_text[:2000]}
-
-Debate Summary:
-{debates_text}
-
-Provide a synthesis that explains:
-1. What worked – Which arguments were strongest and why
-2. What failed – Which factors or arguments were weakest or analytically rejected, and why
-3. Why it happened – Root causes of successes and failures (information sources, incentives, ideology, cognitive bias, etc.)
-4. How it can be improved – Recommendations for better analysis and for avoiding invalid or harmful reasoning in the future
-
-Explicitly note any "Analytically Rejected Factors" and summarize why they fail factual and ethical scrutiny.
-
-Format as structured analysis with clear sections. Avoid phrases like "both sides have merit" when evidence clearly supports one conclusion."""
-
         # Generate structured synthesis with mandatory sections
-        structured_prompt = f"""You are the Synthesizer Agent inside Project AETHER. Review all the structured debates below and extract key insights WITHOUT introducing false balance.
-
-Meta-goal: Project AETHER is not a consensus engine. It is a truth-seeking, failure-detecting analytical system.
-
-Original Document:
-{input_text[:2000]}
-
-Debate Summary:
-{debates_text}
-
-You MUST provide a structured synthesis in JSON format with the following EXACT structure:
-
-{{
-  "what_worked": [
-    {{"factor_id": <id>, "factor_name": "<name>", "reason": "<why it worked>", "confidence": <0.0-1.0>}},
-    ...
-  ],
-  "what_failed": [
-    {{"factor_id": <id>, "factor_name": "<name>", "reason": "<why it failed>", "confidence": <0.0-1.0>}},
-    ...
-  ],
-  "analytically_rejected": [
-    {{"factor_id": <id>, "factor_name": "<name>", "rejection_reason": "<why rejected>", "confidence": 1.0}},
-    ...
-  ],
-  "debate_highlights": [
-    {{"factor_id": <id>, "highlight_type": "strong_claim|concession|deadlock|breakthrough", "description": "<what happened>"}},
-    ...
-  ],
-  "per_factor_confidence": {{
-    "<factor_id>": <0.0-1.0>,
-    ...
-  }},
-  "root_causes": [
-    "<root cause 1>",
-    "<root cause 2>",
-    ...
-  ],
-  "narrative_summary": "<overall synthesis text>"
-}}
-
-Explicitly note any "Analytically Rejected Factors" and summarize why they fail factual and ethical scrutiny.
-Avoid phrases like "both sides have merit" when evidence clearly supports one conclusion."""
+        structured_prompt = (
+            _SYNTHESIS_PROMPT_HEAD + _trunc(input_text, 2000) +
+            _SYNTHESIS_PROMPT_MID + debates_text +
+            _SYNTHESIS_PROMPT_TAIL
+        )
 
         response = await self.llm_client.generate(structured_prompt)
         
@@ -180,21 +198,13 @@ Avoid phrases like "both sides have merit" when evidence clearly supports one co
         structured_data = self._parse_structured_synthesis(response)
         
         # Ensure all mandatory sections exist
-        if not structured_data.get('what_worked'):
-            structured_data['what_worked'] = []
-        if not structured_data.get('what_failed'):
-            structured_data['what_failed'] = []
-        if not structured_data.get('analytically_rejected'):
-            structured_data['analytically_rejected'] = []
-        if not structured_data.get('debate_highlights'):
-            structured_data['debate_highlights'] = []
-        if not structured_data.get('per_factor_confidence'):
-            structured_data['per_factor_confidence'] = {}
+        for section, empty in _EMPTY_STRUCTURED.items():
+            structured_data[section] = structured_data.get(section) or empty.copy()
         
         # Add rejected factors information
         rejected_factors_info = []
         for factor_id in rejected_factor_ids:
-            factor = next((f for f in factors if f['id'] == factor_id), None)
+            factor = factors_by_id.get(factor_id)
             if factor and self.resolution_tracker:
                 resolution = self.resolution_tracker.get_resolution(factor_id)
                 rejected_factors_info.append({
@@ -210,30 +220,25 @@ Avoid phrases like "both sides have merit" when evidence clearly supports one co
             "debate_summary": debates_text,
             "rejected_factors": rejected_factors_info,
             "rejected_debates": rejected_debates_text,
-            "timestamp": self._get_timestamp()
+            "timestamp": Timestamp.now()  # ISO-formatted lazily at serialization
         }
         
+        self.synthesis_triggered = True
         await self._publish(synthesis)
         return synthesis
     
     def _parse_structured_synthesis(self, response: str) -> Dict:
         """Parse structured JSON from LLM response."""
         # Try to extract JSON
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
+        json_text = self._find_json(response, '{', '}')
+        if json_text:
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
+                return orjson.loads(json_text)
+            except orjson.JSONDecodeError:
                 pass
         
         # Fallback: return minimal structure
-        return {
-            "what_worked": [],
-            "what_failed": [],
-            "analytically_rejected": [],
-            "debate_highlights": [],
-            "per_factor_confidence": {},
-            "root_causes": [],
-            "narrative_summary": response
-        }
+        structured = {section: empty.copy() for section, empty in _EMPTY_STRUCTURED.items()}
+        structured["narrative_summary"] = response
+        return structured
 
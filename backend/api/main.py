@@ -2,26 +2,38 @@
 FastAPI Backend for Project AETHER
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
 from typing import Optional, Any, Dict, List
 import sys
 import os
 import asyncio
-import json
+import logging
+import orjson
+import msgspec
 from sse_starlette.sse import EventSourceResponse
 from enum import Enum
 
-# Add parent directory to path to access storage module
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+# Add parent directory to path to access storage module (resolved, and only if it isn't there
+# already, so re-imports don't keep prepending entries every import has to scan)
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 from workflow.orchestrator import Orchestrator
-from llm.llm_client import create_llm_client, LLMProvider
+from coordination.clock import Timestamp
+from coordination.role_policy import RolePolicyEngine
+from validation import FactorValidator
+from llm.batch_processor import BatchProcessor
+from llm.cache import CachedLLMClient
+from llm.retry import retry_counters
+from llm.llm_client import create_llm_client, LLMProvider, aclose_http_client, prewarm_http_client
 from storage.history import HistoryStorage
 from utils.file_parser import parse_file_content
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="Project AETHER API", version="1.0.0")
 
 # CORS middleware
@@ -52,74 +64,241 @@ def get_llm_client():
             print("✓ Fallback to HuggingFace client")
     return llm_client
 
+
+# Background pre-warm task (kept referenced so it isn't garbage-collected mid-flight)
+_prewarm_task: Optional[asyncio.Task] = None
+
+
+@app.on_event("startup")
+async def start_prewarm():
+    """Prime provider connections in the background when PREWARM=1."""
+    global _prewarm_task
+    if os.getenv("PREWARM") == "1":
+        _prewarm_task = asyncio.create_task(prewarm_http_client())
+
+
+# Upper bound on how long shutdown waits for queued history writes
+HISTORY_FLUSH_TIMEOUT = float(os.getenv("HISTORY_FLUSH_TIMEOUT", "10"))
+
+
+@app.on_event("shutdown")
+async def flush_history():
+    """Let the background writer commit analyses that were saved fire-and-forget."""
+    try:
+        await asyncio.wait_for(history_storage.flush(), HISTORY_FLUSH_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("History writer still busy after %.0fs at shutdown", HISTORY_FLUSH_TIMEOUT)
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    """Release the shared LLM HTTP connection pool."""
+    await aclose_http_client()
+
 # Store active orchestrators (for SSE)
 active_orchestrators = {}
 
+# Pool of pre-built orchestrators, reused across requests (lazily created with the LLM client).
+# Analyses are I/O-bound on the LLM provider, so the pool is sized for concurrent requests
+# rather than for CPU cores
+ORCHESTRATOR_POOL_SIZE = int(os.getenv("ORCHESTRATOR_POOL_SIZE", "32"))
+# How long a request waits for a free orchestrator before being turned away with a 503
+ORCHESTRATOR_ACQUIRE_TIMEOUT = float(os.getenv("ORCHESTRATOR_ACQUIRE_TIMEOUT", "30"))
+orchestrator_pool: Optional[asyncio.Queue] = None
+
+
+def get_orchestrator_pool() -> asyncio.Queue:
+    """Lazy initialization of the orchestrator pool."""
+    global orchestrator_pool
+    if orchestrator_pool is None:
+        client = get_llm_client()
+        # Stateless components are shared by every pooled orchestrator
+        policy_engine = RolePolicyEngine()
+        factor_validator = FactorValidator()
+        pool = asyncio.Queue(maxsize=ORCHESTRATOR_POOL_SIZE)
+        for _ in range(ORCHESTRATOR_POOL_SIZE):
+            pool.put_nowait(Orchestrator(client, policy_engine=policy_engine, factor_validator=factor_validator))
+        orchestrator_pool = pool
+    return orchestrator_pool
+
+
+async def acquire_orchestrator() -> Orchestrator:
+    """Take an orchestrator from the pool, waiting up to ORCHESTRATOR_ACQUIRE_TIMEOUT if all are busy."""
+    try:
+        return await asyncio.wait_for(get_orchestrator_pool().get(), ORCHESTRATOR_ACQUIRE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="All orchestrators are busy, try again later")
+
+
+def release_orchestrator(orchestrator: Orchestrator):
+    """Reset an orchestrator's session state and return it to the pool."""
+    orchestrator.reset()
+    get_orchestrator_pool().put_nowait(orchestrator)
+
+
+def save_to_history(result: Dict):
+    """Reserve an analysis ID for the result and queue it for the batched history writer."""
+    analysis_id = history_storage.reserve_id()
+    try:
+        history_storage.enqueue_analysis(analysis_id, result)
+    except asyncio.QueueFull:
+        # Don't fail the request (or grow memory unbounded) if the history writer is behind
+        logger.warning("History write queue full, analysis %s not saved", analysis_id)
+        return
+    result["analysis_id"] = analysis_id
+
+
+async def save_to_history_committed(result: Dict):
+    """Save the result through the batched history writer and wait for its batch to commit."""
+    analysis_id = history_storage.reserve_id()
+    try:
+        await history_storage.save_analysis_async(analysis_id, result)
+    except Exception:
+        # Don't fail the request over history, but don't hand out an ID that can't be fetched
+        logger.exception("Failed to save analysis %s to history", analysis_id)
+        return
+    result["analysis_id"] = analysis_id
+
+# Max buffered progress updates per SSE stream (oldest are dropped when full)
+PROGRESS_QUEUE_MAXSIZE = 256
 
-def _serialize_message_types(obj: Any) -> Any:
-    """Recursively convert MessageType enums to strings for JSON serialization."""
+
+def _enum_default(obj: Any) -> Any:
+    """orjson fallback hook: emit enums as their values and deferred timestamps as ISO strings."""
     if isinstance(obj, Enum):
         return obj.value
-    elif isinstance(obj, dict):
-        return {k: _serialize_message_types(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_serialize_message_types(item) for item in obj]
-    else:
-        return obj
+    if isinstance(obj, Timestamp):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
 
-class TextInput(BaseModel):
-    text: str
-    show_updates: bool = True
+def _dumps(obj: Any) -> bytes:
+    """Serialize an analysis result in a single C-level pass.
+    
+    Debate summaries are keyed by integer factor IDs, so non-str keys are allowed.
+    """
+    return orjson.dumps(obj, default=_enum_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _json_response(result: Dict) -> Response:
+    """Build a JSON response from a raw (possibly Enum-bearing) result dict."""
+    return Response(content=_dumps(result), media_type="application/json")
+
 
+# Pre-encoded SSE envelopes - only the inner "data" payload varies per frame
+_SSE_PROGRESS_PREFIX = b'{"event":"progress","data":'
+_SSE_COMPLETE_PREFIX = b'{"event":"complete","data":'
+_SSE_ERROR_PREFIX = b'{"event":"error","data":'
+_SSE_SUFFIX = b'}'
+_SSE_CONNECTED_DATA = orjson.dumps({
+    "event": "connected",
+    "data": {"message": "Connection established, starting analysis..."}
+}).decode()
 
-class AnalysisRequest(BaseModel):
+
+def _sse_frame(prefix: bytes, payload: Any) -> Dict:
+    """Wrap an encoded payload in a pre-encoded SSE event envelope."""
+    return {
+        "event": "message",
+        "data": (prefix + _dumps(payload) + _SSE_SUFFIX).decode()
+    }
+
+
+# Request bodies are immutable once decoded, and unknown fields are rejected (422)
+class AnalysisRequest(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
     text: str
     show_updates: bool = True
 
 
+_analysis_request_decoder = msgspec.json.Decoder(AnalysisRequest)
+
+
+async def parse_analysis_request(request: Request) -> AnalysisRequest:
+    """Decode and validate the request body straight into an AnalysisRequest."""
+    body = await request.body()
+    try:
+        return _analysis_request_decoder.decode(body)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+class BatchRequest(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    prompts: List[str]
+    max_tokens: int = 2000
+
+
+_batch_request_decoder = msgspec.json.Decoder(BatchRequest)
+
+
+async def parse_batch_request(request: Request) -> BatchRequest:
+    """Decode and validate the request body straight into a BatchRequest."""
+    body = await request.body()
+    try:
+        return _batch_request_decoder.decode(body)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def _request_body_openapi(struct_type: type) -> Dict:
+    """OpenAPI requestBody for a hand-decoded struct, so /docs still documents the body."""
+    _, components = msgspec.json.schema_components([struct_type], ref_template="#/components/schemas/{name}")
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[struct_type.__name__]}}
+        }
+    }
+
+
+batch_processor: Optional[BatchProcessor] = None
+
+
+def get_batch_processor() -> BatchProcessor:
+    """Lazy initialization of the Batch API processor."""
+    global batch_processor
+    if batch_processor is None:
+        try:
+            batch_processor = BatchProcessor()
+        except ValueError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+    return batch_processor
+
+
 @app.get("/")
 async def root():
     return {"message": "Project AETHER API", "status": "running"}
 
 
-@app.post("/api/analyze/text")
-async def analyze_text(request: AnalysisRequest):
+@app.post("/api/analyze/text", openapi_extra=_request_body_openapi(AnalysisRequest))
+async def analyze_text(request: AnalysisRequest = Depends(parse_analysis_request)):
     """Analyze text input."""
     try:
         if not request.text or not request.text.strip():
             raise HTTPException(status_code=400, detail="Text input cannot be empty")
         
-        orchestrator = Orchestrator(get_llm_client())
-        
-        result = await orchestrator.analyze(request.text, request.show_updates)
+        orchestrator = await acquire_orchestrator()
+        try:
+            result = await orchestrator.analyze(request.text, request.show_updates)
+        finally:
+            release_orchestrator(orchestrator)
         
         # Ensure result is a dict
         if not isinstance(result, dict):
             result = {"success": False, "error": "Invalid result format from orchestrator"}
         
-        # Ensure all MessageType enums are converted to strings for JSON serialization
-        result = _serialize_message_types(result)
-        
-        # Save to history
+        # Save to history; clients fetch /api/history/{analysis_id} right after this response,
+        # so wait for the group commit (shared with concurrent saves) before returning the ID
         if result.get("success"):
-            try:
-                analysis_id = history_storage.save_analysis(result)
-                result["analysis_id"] = analysis_id
-            except Exception as e:
-                print(f"Warning: Failed to save to history: {e}")
-                # Don't fail the request if history save fails
+            await save_to_history_committed(result)
         
-        return JSONResponse(content=result)
+        # Enums are converted to strings during serialization
+        return _json_response(result)
     
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         error_msg = str(e)
-        error_trace = traceback.format_exc()
-        print(f"Error in analyze_text: {error_msg}")
-        print(error_trace)
+        logger.exception("Error in analyze_text: %s", error_msg)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {error_msg}")
 
 
@@ -131,40 +310,34 @@ async def analyze_file(file: UploadFile = File(...), show_updates: bool = True):
         content = await file.read()
         filename = file.filename or "unknown"
         
-        # Parse file based on type
+        # Parse file based on type (in a worker thread - PDF/DOCX parsing would block the event loop)
         try:
-            text = parse_file_content(content, filename)
+            text = await asyncio.to_thread(parse_file_content, content, filename)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         
         if not text.strip():
             raise HTTPException(status_code=400, detail="File is empty or contains no text")
         
-        orchestrator = Orchestrator(get_llm_client())
-        result = await orchestrator.analyze(text, show_updates)
-        
-        # Ensure all MessageType enums are converted to strings for JSON serialization
-        result = _serialize_message_types(result)
+        orchestrator = await acquire_orchestrator()
+        try:
+            result = await orchestrator.analyze(text, show_updates)
+        finally:
+            release_orchestrator(orchestrator)
         
-        # Save to history
+        # Save to history; clients fetch /api/history/{analysis_id} right after this response,
+        # so wait for the group commit (shared with concurrent saves) before returning the ID
         if result.get("success"):
-            try:
-                analysis_id = history_storage.save_analysis(result)
-                result["analysis_id"] = analysis_id
-            except Exception as e:
-                print(f"Warning: Failed to save to history: {e}")
-                # Don't fail the request if history save fails
+            await save_to_history_committed(result)
         
-        return JSONResponse(content=result)
+        # Enums are converted to strings during serialization
+        return _json_response(result)
     
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         error_msg = str(e)
-        error_trace = traceback.format_exc()
-        print(f"Error in analyze_file: {error_msg}")
-        print(error_trace)
+        logger.exception("Error in analyze_file: %s", error_msg)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {error_msg}")
 
 
@@ -172,134 +345,174 @@ async def analyze_file(file: UploadFile = File(...), show_updates: bool = True):
 async def analyze_stream(session_id: str, text: str, show_updates: bool = True):
     """Stream analysis updates via SSE."""
     
+    # One adapter per stream: the session context is bound once, not rebuilt per log call
+    stream_logger = logging.LoggerAdapter(logger, {"session_id": session_id})
+    
     async def event_generator():
         # Send initial connection confirmation immediately
         try:
-            yield {
-                "event": "message",
-                "data": json.dumps({
-                    "event": "connected",
-                    "data": {"message": "Connection established, starting analysis..."}
-                })
-            }
+            yield {"event": "message", "data": _SSE_CONNECTED_DATA}
         except Exception as e:
-            print(f"Error sending initial message: {e}")
+            stream_logger.error("Error sending initial message: %s", e)
             return
         
         try:
             # Initialize orchestrator
             try:
-                orchestrator = Orchestrator(get_llm_client())
+                orchestrator = await acquire_orchestrator()
             except Exception as e:
-                yield {
-                    "event": "message",
-                    "data": json.dumps({
-                        "event": "error",
-                        "data": {"error": f"Failed to initialize orchestrator: {str(e)}"}
-                    })
-                }
+                yield _sse_frame(_SSE_ERROR_PREFIX, {"error": f"Failed to initialize orchestrator: {str(e)}"})
                 return
             
-            # Store orchestrator for this session
-            active_orchestrators[session_id] = orchestrator
-            
-            # Set up progress callback with queue
-            progress_queue = asyncio.Queue()
-            
-            def progress_callback(update):
-                try:
-                    progress_queue.put_nowait(update)
-                except:
-                    pass  # Queue full, skip update
-            
-            orchestrator.set_progress_callback(progress_callback)
-            
-            # Start analysis in background
+            analysis_task = None
             try:
-                analysis_task = asyncio.create_task(orchestrator.analyze(text, show_updates))
-            except Exception as e:
-                yield {
-                    "event": "message",
-                    "data": json.dumps({
-                        "event": "error",
-                        "data": {"error": f"Failed to start analysis: {str(e)}"}
-                    })
-                }
-                return
-            
-            # Stream progress updates
-            while True:
+                # Store orchestrator for this session
+                active_orchestrators[session_id] = orchestrator
+                
+                # Set up progress callback with queue
+                progress_queue = asyncio.Queue(maxsize=PROGRESS_QUEUE_MAXSIZE)
+                
+                def progress_callback(update):
+                    try:
+                        progress_queue.put_nowait(update)
+                    except asyncio.QueueFull:
+                        # Coalesce: drop the oldest update so the newest one always wins
+                        try:
+                            progress_queue.get_nowait()
+                            progress_queue.put_nowait(update)
+                        except (asyncio.QueueEmpty, asyncio.QueueFull):
+                            pass
+                
+                orchestrator.set_progress_callback(progress_callback)
+                
+                # Start analysis in background
                 try:
-                    # Check if analysis is done
-                    if analysis_task.done():
-                        result = await analysis_task
+                    analysis_task = asyncio.create_task(orchestrator.analyze(text, show_updates))
+                except Exception as e:
+                    yield _sse_frame(_SSE_ERROR_PREFIX, {"error": f"Failed to start analysis: {str(e)}"})
+                    return
+                
+                # Stream progress updates: sleep until either a progress update
+                # arrives or the analysis finishes (no polling)
+                get_task = None
+                while True:
+                    try:
+                        get_task = asyncio.create_task(progress_queue.get())
+                        done, _ = await asyncio.wait(
+                            {analysis_task, get_task},
+                            return_when=asyncio.FIRST_COMPLETED
+                        )
                         
-                        # Save to history
-                        if result.get("success"):
-                            analysis_id = history_storage.save_analysis(result)
-                            result["analysis_id"] = analysis_id
+                        if get_task in done:
+                            yield _sse_frame(_SSE_PROGRESS_PREFIX, get_task.result())
+                            continue
                         
-                        yield {
-                            "event": "message",
-                            "data": json.dumps({
-                                "event": "complete",
-                                "data": result
-                            })
-                        }
+                        # Analysis is done - flush any remaining progress updates
+                        get_task.cancel()
+                        while not progress_queue.empty():
+                            yield _sse_frame(_SSE_PROGRESS_PREFIX, progress_queue.get_nowait())
                         
-                        # Clean up
-                        if session_id in active_orchestrators:
-                            del active_orchestrators[session_id]
+                        result = analysis_task.result()
+                        
+                        # Save to history (in the background - doesn't block the response)
+                        if result.get("success"):
+                            save_to_history(result)
+                        
+                        yield _sse_frame(_SSE_COMPLETE_PREFIX, result)
                         
                         return
                     
-                    # Try to get progress update (non-blocking)
+                    except asyncio.CancelledError:
+                        if get_task:
+                            get_task.cancel()
+                        break
+                    except Exception as e:
+                        if get_task:
+                            get_task.cancel()
+                        yield _sse_frame(_SSE_ERROR_PREFIX, {"error": str(e)})
+                        break
+            finally:
+                # Stop an abandoned analysis before the orchestrator is reused
+                if analysis_task and not analysis_task.done():
+                    analysis_task.cancel()
                     try:
-                        update = progress_queue.get_nowait()
-                        yield {
-                            "event": "message",
-                            "data": json.dumps({
-                                "event": "progress",
-                                "data": update
-                            })
-                        }
-                    except asyncio.QueueEmpty:
-                        # No update yet, wait a bit
-                        await asyncio.sleep(0.1)
-                
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    yield {
-                        "event": "message",
-                        "data": json.dumps({
-                            "event": "error",
-                            "data": {"error": str(e)}
-                        })
-                    }
-                    break
+                        await analysis_task
+                    except asyncio.CancelledError:
+                        pass
+                active_orchestrators.pop(session_id, None)
+                release_orchestrator(orchestrator)
         
         except Exception as e:
-            import traceback
             error_details = str(e)
-            print(f"SSE Error: {error_details}")
-            print(traceback.format_exc())
-            yield {
-                "event": "message",
-                "data": json.dumps({
-                    "event": "error",
-                    "data": {"error": error_details}
-                })
-            }
+            stream_logger.exception("SSE Error: %s", error_details)
+            yield _sse_frame(_SSE_ERROR_PREFIX, {"error": error_details})
     
     return EventSourceResponse(event_generator())
 
 
+@app.post("/api/batch", openapi_extra=_request_body_openapi(BatchRequest))
+async def submit_batch(request: BatchRequest = Depends(parse_batch_request)):
+    """Submit prompts to the provider Batch API for non-interactive processing."""
+    if not request.prompts:
+        raise HTTPException(status_code=400, detail="At least one prompt is required")
+    processor = get_batch_processor()
+    try:
+        batch_id = await processor.submit_batch(request.prompts, request.max_tokens)
+    except Exception as e:
+        logger.exception("Batch submission failed")
+        raise HTTPException(status_code=502, detail=str(e))
+    return {"batch_id": batch_id}
+
+
+@app.get("/api/batch/{batch_id}")
+async def get_batch(batch_id: str):
+    """Get a batch's status, with results (in prompt order) once it has completed."""
+    processor = get_batch_processor()
+    try:
+        batch = await processor.get_status(batch_id)
+        response = {"batch_id": batch_id, "status": batch.get("status")}
+        if batch.get("status") == "completed":
+            response["results"] = await processor.get_results(batch)
+    except Exception as e:
+        logger.exception("Batch lookup failed")
+        raise HTTPException(status_code=502, detail=str(e))
+    return response
+
+
+@app.get("/health")
+async def health():
+    """Service health, including the LLM provider's circuit breaker state and recent latency."""
+    provider_client = get_llm_client()
+    # Unwrap the cache wrapper to reach the provider client that owns the breaker
+    while getattr(provider_client, "inner", None) is not None:
+        provider_client = provider_client.inner
+    return {
+        "status": "ok",
+        "llm_circuit": provider_client.breaker.snapshot(),
+        "llm_latency": provider_client.latency_stats()
+    }
+
+
+@app.get("/api/metrics/cache")
+async def get_cache_metrics():
+    """LLM response cache hit/miss counters (empty when caching is disabled)."""
+    client = get_llm_client()
+    if isinstance(client, CachedLLMClient):
+        return {"enabled": True, **client.stats()}
+    return {"enabled": False}
+
+
+@app.get("/api/metrics/retries")
+async def get_retry_metrics():
+    """Transient-error retry counters for LLM provider calls."""
+    return retry_counters
+
+
 @app.get("/api/history")
 async def get_history(limit: int = 50):
     """Get analysis history."""
     try:
-        history = history_storage.get_history(limit)
+        history = await history_storage.get_history_async(limit)
         return JSONResponse(content={"history": history})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -309,7 +522,7 @@ async def get_history(limit: int = 50):
 async def get_analysis(analysis_id: int):
     """Get specific analysis by ID."""
     try:
-        analysis = history_storage.get_analysis(analysis_id)
+        analysis = await history_storage.get_analysis_async(analysis_id)
         if not analysis:
             raise HTTPException(status_code=404, detail="Analysis not found")
         return JSONResponse(content=analysis)
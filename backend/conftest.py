@@ -0,0 +1,16 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from llm import cache, circuit_breaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the cache and circuit breaker (advance clock[0] in seconds)."""
+    now = [1000.0]
+    monkeypatch.setattr(cache, "_monotonic", lambda: now[0])
+    monkeypatch.setattr(circuit_breaker, "_monotonic", lambda: now[0])
+    return now
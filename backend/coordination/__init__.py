@@ -6,11 +6,13 @@ from .message_bus import MessageBus, MessageType
 from .agent_registry import AgentRegistry, AgentRole, AgentCapability, RegisteredAgent
 from .role_policy import RolePolicyEngine, ActionType, PolicyViolation
 from .claims import Claim, ClaimStatus, EvidenceStrength, Assumption, Evidence
+from .clock import now_iso, Timestamp
 
 __all__ = [
     'MessageBus', 'MessageType',
     'AgentRegistry', 'AgentRole', 'AgentCapability', 'RegisteredAgent',
     'RolePolicyEngine', 'ActionType', 'PolicyViolation',
-    'Claim', 'ClaimStatus', 'EvidenceStrength', 'Assumption', 'Evidence'
+    'Claim', 'ClaimStatus', 'EvidenceStrength', 'Assumption', 'Evidence',
+    'now_iso', 'Timestamp'
 ]
 
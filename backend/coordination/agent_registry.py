@@ -3,10 +3,11 @@ Agent Registry - Self-Deployment and Discovery System
 Agents register themselves and advertise capabilities.
 """
 
-from typing import Dict, List, Optional, Set, Callable
+from typing import Dict, List, Optional, Set, Callable, Tuple
+import sys
 from enum import Enum
 from dataclasses import dataclass, field
-from datetime import datetime
+from coordination.clock import now_iso
 
 
 class AgentRole(Enum):
@@ -36,7 +37,7 @@ class RegisteredAgent:
     capability: AgentCapability
     endpoint: Optional[str] = None  # For remote agents (URL/address)
     is_local: bool = True
-    registered_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    registered_at: str = field(default_factory=now_iso)
     status: str = "active"  # active, paused, error
 
 
@@ -45,8 +46,11 @@ class AgentRegistry:
     
     def __init__(self):
         self._agents: Dict[str, RegisteredAgent] = {}
-        self._agents_by_role: Dict[AgentRole, List[str]] = {role: [] for role in AgentRole}
-        self._agents_by_output_type: Dict[str, List[str]] = {}  # Message type -> agent IDs
+        # Indices hold agent references directly so lookups need no second hop through _agents.
+        # Each index is an insertion-ordered dict (agent_id -> agent) used as an ordered set,
+        # giving O(1) unregister while keeping deterministic iteration order.
+        self._agents_by_role: Dict[AgentRole, Dict[str, RegisteredAgent]] = {role: {} for role in AgentRole}
+        self._agents_by_output_type: Dict[str, Dict[str, RegisteredAgent]] = {}  # Message type -> agents
     
     def register(
         self,
@@ -72,6 +76,9 @@ class AgentRegistry:
         if agent_id in self._agents:
             raise ValueError(f"Agent {agent_id} already registered")
         
+        # Intern routing keys so index lookups short-circuit on identity
+        agent_id = sys.intern(agent_id)
+        
         registered = RegisteredAgent(
             agent_id=agent_id,
             name=name,
@@ -81,13 +88,14 @@ class AgentRegistry:
         )
         
         self._agents[agent_id] = registered
-        self._agents_by_role[capability.role].append(agent_id)
+        self._agents_by_role[capability.role][agent_id] = registered
         
         # Index by output types for message routing
         for output_type in capability.output_types:
+            output_type = sys.intern(output_type)
             if output_type not in self._agents_by_output_type:
-                self._agents_by_output_type[output_type] = []
-            self._agents_by_output_type[output_type].append(agent_id)
+                self._agents_by_output_type[output_type] = {}
+            self._agents_by_output_type[output_type][agent_id] = registered
         
         return registered
     
@@ -99,14 +107,12 @@ class AgentRegistry:
         agent = self._agents[agent_id]
         
         # Remove from role index
-        if agent_id in self._agents_by_role[agent.capability.role]:
-            self._agents_by_role[agent.capability.role].remove(agent_id)
+        self._agents_by_role[agent.capability.role].pop(agent_id, None)
         
         # Remove from output type index
         for output_type in agent.capability.output_types:
             if output_type in self._agents_by_output_type:
-                if agent_id in self._agents_by_output_type[output_type]:
-                    self._agents_by_output_type[output_type].remove(agent_id)
+                self._agents_by_output_type[output_type].pop(agent_id, None)
         
         del self._agents[agent_id]
         return True
@@ -115,15 +121,13 @@ class AgentRegistry:
         """Get agent by ID."""
         return self._agents.get(agent_id)
     
-    def get_agents_by_role(self, role: AgentRole) -> List[RegisteredAgent]:
-        """Get all agents with a specific role."""
-        agent_ids = self._agents_by_role.get(role, [])
-        return [self._agents[aid] for aid in agent_ids if aid in self._agents]
+    def get_agents_by_role(self, role: AgentRole) -> Tuple[RegisteredAgent, ...]:
+        """Get all agents with a specific role (read-only snapshot)."""
+        return tuple(self._agents_by_role.get(role, {}).values())
     
-    def get_agents_by_output_type(self, message_type: str) -> List[RegisteredAgent]:
-        """Get agents that can produce a specific message type."""
-        agent_ids = self._agents_by_output_type.get(message_type, [])
-        return [self._agents[aid] for aid in agent_ids if aid in self._agents]
+    def get_agents_by_output_type(self, message_type: str) -> Tuple[RegisteredAgent, ...]:
+        """Get agents that can produce a specific message type (read-only snapshot)."""
+        return tuple(self._agents_by_output_type.get(message_type, {}).values())
     
     def list_all_agents(self) -> List[RegisteredAgent]:
         """List all registered agents."""
@@ -132,5 +136,5 @@ class AgentRegistry:
     def clear(self):
         """Clear all registrations (for testing/reset)."""
         self._agents.clear()
-        self._agents_by_role = {role: [] for role in AgentRole}
+        self._agents_by_role = {role: {} for role in AgentRole}
         self._agents_by_output_type.clear()
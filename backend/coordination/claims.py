@@ -7,7 +7,7 @@ They can be weakened or invalidated through debate.
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Set
 from enum import Enum
-from datetime import datetime
+from coordination.clock import now_iso
 
 
 class ClaimStatus(Enum):
@@ -29,7 +29,16 @@ class EvidenceStrength(Enum):
     CONCLUSIVE = 4
 
 
-@dataclass
+# Hoisted enum values for hot-path comparisons
+_STRONG = EvidenceStrength.STRONG.value
+_NO_EVIDENCE = EvidenceStrength.NONE.value
+
+# Value -> member maps for deserialization; falls back to the Enum call only for unknown values
+_EVIDENCE_STRENGTHS = EvidenceStrength._value2member_map_
+_CLAIM_STATUSES = ClaimStatus._value2member_map_
+
+
+@dataclass(slots=True)
 class Assumption:
     """An assumption underlying a claim."""
     description: str
@@ -37,7 +46,7 @@ class Assumption:
     challenge_reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Evidence supporting or challenging a claim."""
     description: str
@@ -46,7 +55,7 @@ class Evidence:
     challenges_assumption: Optional[str] = None  # Which assumption this challenges
 
 
-@dataclass
+@dataclass(slots=True)
 class Claim:
     """
     A structured claim that can be attacked and invalidated.
@@ -72,8 +81,12 @@ class Claim:
     rebuttals: List[str] = field(default_factory=list)  # IDs of rebuttal claims
     
     # Metadata
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=now_iso)
+    updated_at: str = field(default_factory=now_iso)
+    
+    # Status bookkeeping for _update_status, kept in sync by the mutators below
+    _invalid_mask: int = field(default=0, init=False, repr=False, compare=False)  # bit i = assumption i invalid
+    _max_evidence_strength: int = field(default=_NO_EVIDENCE, init=False, repr=False, compare=False)
     
     def add_assumption(self, description: str) -> Assumption:
         """Add an assumption to this claim."""
@@ -85,6 +98,7 @@ class Claim:
         """Add evidence supporting this claim."""
         evidence = Evidence(description=description, strength=strength, source=source)
         self.evidence.append(evidence)
+        self._max_evidence_strength = max(self._max_evidence_strength, strength.value)
         return evidence
     
     def challenge_assumption(self, assumption_idx: int, reason: str) -> bool:
@@ -97,6 +111,7 @@ class Claim:
         if 0 <= assumption_idx < len(self.assumptions):
             self.assumptions[assumption_idx].is_valid = False
             self.assumptions[assumption_idx].challenge_reason = reason
+            self._invalid_mask |= 1 << assumption_idx
             self._update_status()
             return True
         return False
@@ -106,31 +121,43 @@ class Claim:
         self.confidence = max(0.0, self.confidence - 0.2)
         if self.status == ClaimStatus.SUPPORTED:
             self.status = ClaimStatus.WEAKENED
-        self.updated_at = datetime.utcnow().isoformat()
+        self.updated_at = now_iso()
     
     def invalidate(self, reason: str):
         """Invalidate the claim completely."""
         self.status = ClaimStatus.INVALIDATED
         self.confidence = 0.0
-        self.updated_at = datetime.utcnow().isoformat()
+        self.updated_at = now_iso()
     
     def concede(self):
         """Concede the claim (proponent gives up)."""
         self.status = ClaimStatus.CONCEDED
-        self.updated_at = datetime.utcnow().isoformat()
+        self.updated_at = now_iso()
+    
+    def _rebuild_status_index(self):
+        """Recompute status bookkeeping after assumptions/evidence were assigned directly."""
+        self._invalid_mask = 0
+        for idx, assumption in enumerate(self.assumptions):
+            if assumption.is_valid is False:
+                self._invalid_mask |= 1 << idx
+        self._max_evidence_strength = max(
+            (e.strength.value for e in self.evidence),
+            default=_NO_EVIDENCE
+        )
     
     def _update_status(self):
-        """Update status based on assumptions and evidence."""
+        """Update status based on assumptions and evidence (integer checks, no iteration)."""
+        all_assumptions_mask = (1 << len(self.assumptions)) - 1
         # If all assumptions are invalid, claim is invalidated
-        if self.assumptions and all(a.is_valid is False for a in self.assumptions):
+        if self.assumptions and self._invalid_mask == all_assumptions_mask:
             self.status = ClaimStatus.INVALIDATED
             self.confidence = 0.0
         # If any assumption is invalid, claim is weakened
-        elif any(a.is_valid is False for a in self.assumptions):
+        elif self._invalid_mask:
             self.status = ClaimStatus.WEAKENED
             self.confidence = max(0.0, self.confidence - 0.3)
         # If claim has strong evidence and no invalid assumptions, it's supported
-        elif self.evidence and any(e.strength.value >= EvidenceStrength.STRONG.value for e in self.evidence):
+        elif self._max_evidence_strength >= _STRONG:
             if self.status == ClaimStatus.PENDING:
                 self.status = ClaimStatus.SUPPORTED
     
@@ -167,37 +194,36 @@ class Claim:
     
     @classmethod
     def from_dict(cls, data: Dict) -> "Claim":
-        """Create claim from dictionary."""
+        """Create claim from dictionary (all fields passed to a single constructor call)."""
         claim = cls(
             claim_id=data["claim_id"],
             content=data["content"],
             factor_id=data.get("factor_id"),
-            agent_id=data.get("agent_id", "")
+            agent_id=data.get("agent_id", ""),
+            assumptions=[
+                Assumption(
+                    description=a["description"],
+                    is_valid=a.get("is_valid"),
+                    challenge_reason=a.get("challenge_reason")
+                )
+                for a in data.get("assumptions", [])
+            ],
+            evidence=[
+                Evidence(
+                    description=e["description"],
+                    strength=_EVIDENCE_STRENGTHS.get(e["strength"]) or EvidenceStrength(e["strength"]),
+                    source=e.get("source")
+                )
+                for e in data.get("evidence", [])
+            ],
+            status=_CLAIM_STATUSES.get(data["status"]) or ClaimStatus(data["status"]),
+            confidence=data["confidence"],
+            challenges=data.get("challenges", []),
+            rebuttals=data.get("rebuttals", []),
+            created_at=data["created_at"] if "created_at" in data else now_iso(),
+            updated_at=data["updated_at"] if "updated_at" in data else now_iso()
         )
         
-        claim.assumptions = [
-            Assumption(
-                description=a["description"],
-                is_valid=a.get("is_valid"),
-                challenge_reason=a.get("challenge_reason")
-            )
-            for a in data.get("assumptions", [])
-        ]
-        
-        claim.evidence = [
-            Evidence(
-                description=e["description"],
-                strength=EvidenceStrength(e["strength"]),
-                source=e.get("source")
-            )
-            for e in data.get("evidence", [])
-        ]
-        
-        claim.status = ClaimStatus(data["status"])
-        claim.confidence = data["confidence"]
-        claim.challenges = data.get("challenges", [])
-        claim.rebuttals = data.get("rebuttals", [])
-        claim.created_at = data.get("created_at", datetime.utcnow().isoformat())
-        claim.updated_at = data.get("updated_at", datetime.utcnow().isoformat())
+        claim._rebuild_status_index()
         
         return claim
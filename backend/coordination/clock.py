@@ -0,0 +1,43 @@
+"""
+Clock - Cheap wall-clock timestamps for the coordination layer.
+The "YYYY-MM-DDTHH:MM:SS" prefix is formatted once per second; only the microseconds vary per call.
+"""
+
+from datetime import datetime, timezone
+import time
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last formatted time
+_now_iso_cache = (-1, "")
+
+
+def now_iso() -> str:
+    """
+    Get the current UTC time as an ISO string (same shape as datetime.utcnow().isoformat()).
+    Builds the string from time.time_ns() without allocating a datetime.
+    """
+    global _now_iso_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _now_iso_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _now_iso_cache = (seconds, prefix)
+    micros = nanos // 1000
+    # isoformat() omits the fraction entirely when it is zero
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+
+class Timestamp(float):
+    """
+    Epoch-seconds timestamp whose ISO formatting is deferred.
+    Captured with a cheap time.time() call; formatted only when serialized.
+    """
+    
+    @classmethod
+    def now(cls) -> "Timestamp":
+        """Capture the current time."""
+        return cls(time.time())
+    
+    def isoformat(self) -> str:
+        """Format as a naive UTC ISO string (same shape as datetime.utcnow().isoformat())."""
+        return datetime.fromtimestamp(self, tz=timezone.utc).replace(tzinfo=None).isoformat()
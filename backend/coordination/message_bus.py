@@ -4,9 +4,14 @@ Supports publish/subscribe pattern for reactive agent behavior.
 """
 
 from enum import Enum
-from typing import List, Dict, Optional, Callable, Set
-from datetime import datetime
+from typing import Any, List, Dict, Optional, Callable, Tuple
+from collections import defaultdict
 import asyncio
+import logging
+import sys
+from coordination.clock import now_iso
+
+logger = logging.getLogger(__name__)
 
 
 class MessageType(Enum):
@@ -20,21 +25,40 @@ class MessageType(Enum):
     FINAL_DIRECTIVE = "FINAL_DIRECTIVE"
 
 
+# Plain-string message type values used on the publish / summary hot paths
+_FACTOR_LIST = MessageType.FACTOR_LIST.value
+_FACTOR_DISCOVERED = MessageType.FACTOR_DISCOVERED.value
+_SUPPORT_ARGUMENT = MessageType.SUPPORT_ARGUMENT.value
+_CRITIQUE = MessageType.CRITIQUE.value
+_REBUTTAL = MessageType.REBUTTAL.value
+
+
 class MessageBus:
     """
     Event-driven message bus with subscription support.
     Agents subscribe to message types and react automatically.
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrent_factors: int = 8):
         self.messages: List[Dict] = []
         self.factors: List[Dict] = []
+        self._factors_by_id: Dict[int, Dict] = {}
         
-        # Subscription system: message_type -> list of handler callbacks
-        self._subscriptions: Dict[str, List[Callable]] = {}
+        # Indexes maintained on publish: message_type -> messages, factor_id -> message_type -> messages
+        self._by_type: Dict[str, List[Dict]] = defaultdict(list)
+        self._by_factor: Dict[Any, Dict[str, List[Dict]]] = defaultdict(lambda: defaultdict(list))
+        
+        # Subscription system: message_type -> {handler callback: is_coroutine_function}
+        # (insertion-ordered, so handlers still fire in subscription order)
+        self._subscriptions: Dict[str, Dict[Callable, bool]] = {}
+        # Immutable per-type snapshots of the above, rebuilt on (un)subscribe and read on dispatch
+        self._handler_snapshots: Dict[str, Tuple[Tuple[Callable, bool], ...]] = {}
+        # Bounds how many factors' FACTOR_DISCOVERED handlers run at once on a FACTOR_LIST fan-out
+        self._factor_slots = asyncio.Semaphore(max(1, max_concurrent_factors))
         
         # Track which agents have handled which messages (for idempotency)
-        self._handled_by: Dict[str, Set[str]] = {}  # message_id -> set of agent_ids
+        self._handled_by: Dict[str, int] = {}  # message_id -> bitset of agent bits
+        self._agent_bits: Dict[str, int] = {}  # agent_id -> single-bit mask
     
     def subscribe(self, message_type: str, handler: Callable):
         """
@@ -44,15 +68,16 @@ class MessageBus:
             message_type: The message type to listen for
             handler: Async callback function(message: Dict) -> None
         """
-        if message_type not in self._subscriptions:
-            self._subscriptions[message_type] = []
-        self._subscriptions[message_type].append(handler)
+        # Classify once here rather than on every publish
+        handlers = self._subscriptions.setdefault(message_type, {})
+        handlers[handler] = asyncio.iscoroutinefunction(handler)
+        self._handler_snapshots[message_type] = tuple(handlers.items())
     
     def unsubscribe(self, message_type: str, handler: Callable):
         """Unsubscribe from a message type."""
-        if message_type in self._subscriptions:
-            if handler in self._subscriptions[message_type]:
-                self._subscriptions[message_type].remove(handler)
+        handlers = self._subscriptions.get(message_type)
+        if handlers and handlers.pop(handler, None) is not None:
+            self._handler_snapshots[message_type] = tuple(handlers.items())
     
     async def publish(self, message: Dict, agent_id: Optional[str] = None):
         """
@@ -62,54 +87,118 @@ class MessageBus:
             message: Message dictionary with 'type' field
             agent_id: Optional ID of agent publishing (for tracking)
         """
+        self._record(message, agent_id)
+        message_type = message.get('type')
+        # Fast path: nothing subscribes to this type, so there is nothing to dispatch or await
+        if message_type != _FACTOR_LIST and not self._handler_snapshots.get(message_type):
+            return
+        await self._dispatch(message, agent_id)
+    
+    def _record(self, message: Dict, agent_id: Optional[str]):
+        """Stamp a message with bus metadata and append it to the log."""
         if not isinstance(message, dict):
             raise ValueError("Message must be a dictionary")
         
-        message['timestamp'] = message.get('timestamp', datetime.utcnow().isoformat())
-        message['id'] = message.get('id', f"msg_{len(self.messages)}")
-        message['publisher'] = agent_id
+        if 'timestamp' not in message:
+            message['timestamp'] = now_iso()
+        if 'id' not in message:
+            message['id'] = f"msg_{len(self.messages)}"
+        message['publisher'] = sys.intern(agent_id) if agent_id else agent_id
+        
+        # Intern the routing key so subscription lookups short-circuit on identity
+        if isinstance(message.get('type'), str):
+            message['type'] = sys.intern(message['type'])
         
         self.messages.append(message)
         
+        message_type = message.get('type')
+        self._by_type[message_type].append(message)
+        factor_id = message.get('factor_id')
+        if factor_id is not None:
+            self._by_factor[factor_id][message_type].append(message)
+    
+    async def _dispatch(self, message: Dict, agent_id: Optional[str]):
+        """Expand FACTOR_LIST messages and notify subscribers of a recorded message."""
         # Store factors separately for easy access
-        if message.get('type') == MessageType.FACTOR_LIST.value:
+        if message.get('type') == _FACTOR_LIST:
             self.factors = message.get('factors', [])
-            # Also publish individual FACTOR_DISCOVERED events for reactive processing
+            # First factor wins on duplicate IDs, matching the old linear scan
+            self._factors_by_id = {}
             for factor in self.factors:
-                await self.publish({
-                    'type': MessageType.FACTOR_DISCOVERED.value,
+                self._factors_by_id.setdefault(factor.get('id'), factor)
+            
+            # Also publish individual FACTOR_DISCOVERED events for reactive processing:
+            # record them all, then notify subscribers with at most max_concurrent_factors
+            # factors in flight
+            events = [
+                {
+                    'type': _FACTOR_DISCOVERED,
                     'factor': factor,
                     'factor_id': factor.get('id')
-                }, agent_id=agent_id)
+                }
+                for factor in self.factors
+            ]
+            for event in events:
+                self._record(event, agent_id)
+            if self._handler_snapshots.get(_FACTOR_DISCOVERED):
+                await asyncio.gather(*(self._notify_factor(event) for event in events))
         
-        # Notify subscribers
-        message_type = message.get('type')
-        if message_type in self._subscriptions:
-            # Call all subscribers asynchronously
-            tasks = []
-            for handler in self._subscriptions[message_type]:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        tasks.append(asyncio.create_task(handler(message)))
-                    else:
-                        # Sync handler, wrap in async
-                        handler(message)
-                except Exception as e:
-                    print(f"Error in subscription handler for {message_type}: {e}")
-            
-            # Wait for all async handlers
+        # Notify subscribers and wait for all async handlers
+        handlers = self._handler_snapshots.get(message.get('type'))
+        if not handlers:
+            return
+        if len(handlers) == 1:
+            # Common case: a single subscriber is awaited inline - no task or gather future
+            (handler, is_coroutine), = handlers
+            try:
+                if is_coroutine:
+                    await handler(message)
+                else:
+                    handler(message)
+            except Exception as e:
+                logger.error("Error in subscription handler for %s: %s", message.get('type'), e)
+            return
+        tasks = self._notify(message)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _notify_factor(self, event: Dict):
+        """Notify FACTOR_DISCOVERED subscribers once a factor slot is free."""
+        async with self._factor_slots:
+            tasks = self._notify(event)
             if tasks:
                 await asyncio.gather(*tasks, return_exceptions=True)
     
+    def _notify(self, message: Dict) -> List[asyncio.Task]:
+        """Run sync subscribers and schedule async ones, returning the scheduled tasks."""
+        message_type = message.get('type')
+        handlers = self._handler_snapshots.get(message_type)
+        if not handlers:
+            return []
+        tasks = []
+        # Snapshots are replaced, never mutated, so a handler may (un)subscribe while we iterate
+        for handler, is_coroutine in handlers:
+            try:
+                if is_coroutine:
+                    tasks.append(asyncio.create_task(handler(message)))
+                else:
+                    # Sync handler, wrap in async
+                    handler(message)
+            except Exception as e:
+                logger.error("Error in subscription handler for %s: %s", message_type, e)
+        return tasks
+    
     def mark_handled(self, message_id: str, agent_id: str):
         """Mark a message as handled by an agent (for idempotency)."""
-        if message_id not in self._handled_by:
-            self._handled_by[message_id] = set()
-        self._handled_by[message_id].add(agent_id)
+        bit = self._agent_bits.get(agent_id)
+        if bit is None:
+            bit = self._agent_bits[agent_id] = 1 << len(self._agent_bits)
+        self._handled_by[message_id] = self._handled_by.get(message_id, 0) | bit
     
     def is_handled_by(self, message_id: str, agent_id: str) -> bool:
         """Check if a message was already handled by an agent."""
-        return agent_id in self._handled_by.get(message_id, set())
+        bit = self._agent_bits.get(agent_id)
+        return bit is not None and bool(self._handled_by.get(message_id, 0) & bit)
     
     def get_all_messages(self) -> List[Dict]:
         """Get all messages in chronological order."""
@@ -117,27 +206,25 @@ class MessageBus:
     
     def get_messages_by_type(self, message_type: MessageType) -> List[Dict]:
         """Get messages of a specific type."""
-        return [
-            msg for msg in self.messages
-            if msg.get('type') == message_type.value
-        ]
+        return list(self._by_type.get(message_type.value, ()))
     
     def get_factors(self) -> List[Dict]:
-        """Get all extracted factors."""
-        return self.factors.copy()
+        """Get all extracted factors (shared list - callers must not mutate it)."""
+        return self.factors
     
     def get_factor(self, factor_id: int) -> Optional[Dict]:
         """Get a specific factor by ID."""
-        for factor in self.factors:
-            if factor.get('id') == factor_id:
-                return factor
-        return None
+        return self._factors_by_id.get(factor_id)
     
     def clear(self):
         """Clear all messages and factors."""
         self.messages = []
         self.factors = []
+        self._factors_by_id = {}
+        self._by_type.clear()
+        self._by_factor.clear()
         self._handled_by.clear()
+        self._agent_bits.clear()
     
     def get_debate_summary(self) -> Dict:
         """Get a summary of all debates organized by factor."""
@@ -145,28 +232,22 @@ class MessageBus:
         
         for factor in self.factors:
             factor_id = factor['id']
+            supports = critiques = rebuttals = ()
+            
+            # Messages are indexed per factor on publish - no scan of the full log
+            by_type = self._by_factor.get(factor_id) if factor_id else None
+            if by_type:
+                supports = by_type.get(_SUPPORT_ARGUMENT, ())
+                critiques = by_type.get(_CRITIQUE, ())
+                rebuttals = by_type.get(_REBUTTAL, ())
+            
             summary[factor_id] = {
                 "factor": factor,
-                "support": None,
-                "critique": None,
-                "rebuttal": None,
-                "debate_rounds": 0
+                "support": supports[-1] if supports else None,
+                "critique": critiques[-1] if critiques else None,
+                "rebuttal": rebuttals[-1] if rebuttals else None,
+                "debate_rounds": len(supports) + len(critiques) + len(rebuttals)
             }
         
-        for msg in self.messages:
-            msg_type = msg.get('type')
-            factor_id = msg.get('factor_id')
-            
-            if factor_id and factor_id in summary:
-                if msg_type == MessageType.SUPPORT_ARGUMENT.value:
-                    summary[factor_id]['support'] = msg
-                    summary[factor_id]['debate_rounds'] += 1
-                elif msg_type == MessageType.CRITIQUE.value:
-                    summary[factor_id]['critique'] = msg
-                    summary[factor_id]['debate_rounds'] += 1
-                elif msg_type == MessageType.REBUTTAL.value:
-                    summary[factor_id]['rebuttal'] = msg
-                    summary[factor_id]['debate_rounds'] += 1
-        
         return summary
 
@@ -4,8 +4,10 @@ Enforces agent role constraints at runtime.
 Prevents agents from exceeding their scope.
 """
 
-from typing import Dict, Set, Optional
-from enum import Enum
+from typing import Dict, Set, Optional, Callable, Iterable
+from enum import IntFlag, auto
+from functools import reduce
+from operator import or_
 from coordination.agent_registry import AgentRole, RegisteredAgent
 
 
@@ -14,15 +16,23 @@ class PolicyViolation(Exception):
     pass
 
 
-class ActionType(Enum):
-    """Types of actions agents can attempt."""
-    EXTRACT_FACTORS = "extract_factors"
-    GENERATE_SUPPORT = "generate_support"
-    GENERATE_CRITIQUE = "generate_critique"
-    GENERATE_REBUTTAL = "generate_rebuttal"
-    SYNTHESIZE = "synthesize"
-    GENERATE_FINAL_REPORT = "generate_final_report"
-    PUBLISH_MESSAGE = "publish_message"
+class ActionType(IntFlag):
+    """Types of actions agents can attempt (one bit each, so permissions form a bitmask)."""
+    EXTRACT_FACTORS = auto()
+    GENERATE_SUPPORT = auto()
+    GENERATE_CRITIQUE = auto()
+    GENERATE_REBUTTAL = auto()
+    SYNTHESIZE = auto()
+    GENERATE_FINAL_REPORT = auto()
+    PUBLISH_MESSAGE = auto()
+
+
+def _build_role_masks(table: Dict[AgentRole, Iterable], bit_of: Callable) -> Dict[AgentRole, int]:
+    """Collapse a role -> allowed-items table into role -> bitmask."""
+    return {
+        role: reduce(or_, (bit_of(item) for item in items), 0)
+        for role, items in table.items()
+    }
 
 
 class RolePolicyEngine:
@@ -62,6 +72,14 @@ class RolePolicyEngine:
         AgentRole.FINAL_DECISION: {"FINAL_DIRECTIVE"}
     }
     
+    # Precomputed bitmasks so each validation is a single integer AND
+    _ROLE_ACTION_MASKS: Dict[AgentRole, int] = _build_role_masks(ROLE_PERMISSIONS, int)
+    _MESSAGE_TYPE_BITS: Dict[str, int] = {
+        message_type: 1 << idx
+        for idx, message_type in enumerate(sorted(set().union(*ROLE_OUTPUT_TYPES.values())))
+    }
+    _ROLE_OUTPUT_MASKS: Dict[AgentRole, int] = _build_role_masks(ROLE_OUTPUT_TYPES, _MESSAGE_TYPE_BITS.__getitem__)
+    
     def __init__(self):
         self._enabled = True  # Can be disabled for testing
     
@@ -82,12 +100,12 @@ class RolePolicyEngine:
         if not self._enabled:
             return True
         
-        allowed_actions = self.ROLE_PERMISSIONS.get(agent.capability.role, set())
+        role = agent.capability.role
         
-        if action not in allowed_actions:
+        if not action & self._ROLE_ACTION_MASKS.get(role, 0):
             raise PolicyViolation(
-                f"Agent {agent.name} (role: {agent.capability.role.value}) "
-                f"is not allowed to perform action: {action.value}"
+                f"Agent {agent.name} (role: {role.value}) "
+                f"is not allowed to perform action: {action.name.lower()}"
             )
         
         return True
@@ -109,11 +127,11 @@ class RolePolicyEngine:
         if not self._enabled:
             return True
         
-        allowed_types = self.ROLE_OUTPUT_TYPES.get(agent.capability.role, set())
+        role = agent.capability.role
         
-        if message_type not in allowed_types:
+        if not self._MESSAGE_TYPE_BITS.get(message_type, 0) & self._ROLE_OUTPUT_MASKS.get(role, 0):
             raise PolicyViolation(
-                f"Agent {agent.name} (role: {agent.capability.role.value}) "
+                f"Agent {agent.name} (role: {role.value}) "
                 f"is not allowed to publish message type: {message_type}"
             )
         
@@ -4,6 +4,7 @@ Supports multiple LLM providers (Hugging Face, OpenRouter, etc.)
 """
 
 from .llm_client import LLMClient, LLMProvider
+from .cache import CachedLLMClient
 
-__all__ = ['LLMClient', 'LLMProvider']
+__all__ = ['LLMClient', 'LLMProvider', 'CachedLLMClient']
 
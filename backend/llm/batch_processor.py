@@ -0,0 +1,113 @@
+"""
+Batch Processor - Provider Batch API for non-interactive LLM workloads
+"""
+
+from typing import Dict, List, Optional
+import asyncio
+import os
+import orjson
+
+from .llm_client import get_http_client
+
+# Batch states after which a batch will not change any more
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class BatchProcessor:
+    """Submits prompts as a JSONL batch to an OpenAI-compatible Batch API, polls it, and collects results."""
+    
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 model: Optional[str] = None):
+        # Groq exposes the OpenAI Batch API (files + batches) at discounted pricing
+        self.api_key = api_key or os.getenv("BATCH_API_KEY") or os.getenv("GROQ_API_KEY")
+        if not self.api_key:
+            raise ValueError("Batch API key required. Set BATCH_API_KEY or GROQ_API_KEY environment variable.")
+        self.base_url = (base_url or os.getenv("BATCH_API_BASE", "https://api.groq.com/openai/v1")).rstrip("/")
+        self.model = model or os.getenv("BATCH_MODEL", "llama-3.3-70b-versatile")
+        self.headers = {"Authorization": f"Bearer {self.api_key}"}
+    
+    def _build_jsonl(self, prompts: List[str], max_tokens: int) -> bytes:
+        """One chat completions request per line; custom_id carries the prompt's position."""
+        lines = [
+            orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "user", "content": prompt}
+                    ],
+                    "max_tokens": max_tokens
+                }
+            })
+            for index, prompt in enumerate(prompts)
+        ]
+        return b"\n".join(lines) + b"\n"
+    
+    async def submit_batch(self, prompts: List[str], max_tokens: int = 2000) -> str:
+        """Upload the prompts and create a batch job; returns the batch ID."""
+        client = get_http_client()
+        upload = await client.post(
+            f"{self.base_url}/files",
+            headers=self.headers,
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", self._build_jsonl(prompts, max_tokens), "application/jsonl")},
+            timeout=120.0
+        )
+        upload.raise_for_status()
+        
+        response = await client.post(
+            f"{self.base_url}/batches",
+            headers={**self.headers, "Content-Type": "application/json"},
+            content=orjson.dumps({
+                "input_file_id": orjson.loads(upload.content)["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h"
+            }),
+            timeout=60.0
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)["id"]
+    
+    async def get_status(self, batch_id: str) -> Dict:
+        """Fetch the batch object (status, request counts, output file ID)."""
+        response = await get_http_client().get(f"{self.base_url}/batches/{batch_id}", headers=self.headers, timeout=30.0)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def get_results(self, batch: Dict) -> List[Optional[str]]:
+        """Download a completed batch's output, ordered like the submitted prompts (None for failed requests)."""
+        total = batch.get("request_counts", {}).get("total", 0)
+        results: List[Optional[str]] = [None] * total
+        output_file_id = batch.get("output_file_id")
+        if not output_file_id:
+            return results
+        
+        response = await get_http_client().get(
+            f"{self.base_url}/files/{output_file_id}/content",
+            headers=self.headers,
+            timeout=120.0
+        )
+        response.raise_for_status()
+        for line in response.content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            index = int(record["custom_id"])
+            body = (record.get("response") or {}).get("body") or {}
+            choices = body.get("choices")
+            if choices and index < total:
+                results[index] = choices[0]["message"]["content"]
+        return results
+    
+    async def run_batch(self, prompts: List[str], max_tokens: int = 2000,
+                        poll_interval: float = 30.0) -> List[Optional[str]]:
+        """Submit a batch and wait for it to finish; returns responses in prompt order."""
+        batch_id = await self.submit_batch(prompts, max_tokens)
+        while True:
+            batch = await self.get_status(batch_id)
+            if batch.get("status") in _TERMINAL_STATUSES:
+                break
+            await asyncio.sleep(poll_interval)
+        return await self.get_results(batch)
@@ -0,0 +1,132 @@
+"""
+LLM Response Cache - Exact-match caching of LLM generations
+"""
+
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+import os
+import time
+import orjson
+
+from .llm_client import LLMClient
+
+# Optional fast non-cryptographic hash for cache keys (falls back to SHA-256)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Recent prompts whose cache key is remembered, so repeated prompts skip rehashing
+KEY_MEMO_SIZE = 128
+
+# Clock used for entry expiry (tests patch this alias rather than time.monotonic)
+_monotonic = time.monotonic
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry TTL."""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= _monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: str, ttl: float):
+        """Store a value for ttl seconds, evicting the least recently used entry when full."""
+        self._entries[key] = (_monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+def _is_error_response(text: str) -> bool:
+    """Providers report failures as "[<Provider> Error: ...]" strings; those must not be cached."""
+    return text.startswith("[") and " Error: " in text[:64]
+
+
+class CachedLLMClient(LLMClient):
+    """Wraps an LLM client so identical (provider, model, prompt, params) calls hit the network once."""
+    
+    def __init__(self, inner: LLMClient, backend: Optional[MemoryCacheBackend] = None,
+                 ttl: float = 3600, force: bool = False):
+        self.inner = inner
+        self.backend = backend or MemoryCacheBackend(int(os.getenv("LLM_CACHE_MAXSIZE", "1024")))
+        self.ttl = ttl
+        # Caching sampled (temperature > 0) output is only done when explicitly forced
+        self.force = force
+        self.hits = 0
+        self.misses = 0
+        self._key_memo: "OrderedDict[tuple, str]" = OrderedDict()
+    
+    @property
+    def temperature(self) -> float:
+        return self.inner.temperature
+    
+    def _cache_key(self, prompt: str, max_tokens: int) -> str:
+        """Hash of everything that determines the response, memoized for recently seen prompts."""
+        provider = self.inner
+        temperature = provider.temperature
+        memo_key = (prompt, max_tokens, temperature)
+        key = self._key_memo.get(memo_key)
+        if key is not None:
+            self._key_memo.move_to_end(memo_key)
+            return key
+        
+        params = {
+            "provider": type(provider).__name__,
+            "model": getattr(provider, "model_name", None) or getattr(provider, "model", None),
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        hasher = xxhash.xxh3_128() if xxhash is not None else hashlib.sha256()
+        # The JSON object is self-delimiting, so the prompt bytes can follow it directly
+        hasher.update(orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        hasher.update(prompt.encode())
+        key = hasher.hexdigest()
+        
+        self._key_memo[memo_key] = key
+        if len(self._key_memo) > KEY_MEMO_SIZE:
+            self._key_memo.popitem(last=False)
+        return key
+    
+    async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
+        """Return the cached response if present, otherwise generate and cache it."""
+        if not self.force and self.inner.temperature > 0:
+            return await self.inner.generate(prompt, max_tokens)
+        
+        key = self._cache_key(prompt, max_tokens)
+        cached = self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        
+        self.misses += 1
+        response = await self.inner.generate(prompt, max_tokens)
+        if response and not _is_error_response(response):
+            self.backend.set(key, response, self.ttl)
+        return response
+    
+    def stats(self) -> dict:
+        """Hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "exact_hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,97 @@
+"""
+Circuit Breaker - Fail fast on a provider that keeps erroring
+"""
+
+from enum import Enum
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures that open the circuit
+FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+# Seconds an open circuit waits before letting a probe request through
+OPEN_TIMEOUT = float(os.getenv("CIRCUIT_OPEN_TIMEOUT", "30"))
+# Consecutive successful probes that close a half-open circuit
+SUCCESS_THRESHOLD = int(os.getenv("CIRCUIT_SUCCESS_THRESHOLD", "2"))
+
+# Clock used for the open timeout (tests patch this alias rather than time.monotonic)
+_monotonic = time.monotonic
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+    pass
+
+
+class CircuitBreaker:
+    """Closed -> Open after repeated failures; Half-open probes after a cool-down before closing again."""
+    
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 timeout: float = OPEN_TIMEOUT, success_threshold: int = SUCCESS_THRESHOLD):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.timeout = timeout
+        self.success_threshold = success_threshold
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._successes = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+    
+    def before_call(self):
+        """Admit a call, or raise CircuitOpenError if the circuit is open."""
+        if self.state is CircuitState.CLOSED:
+            return
+        if self.state is CircuitState.OPEN:
+            if _monotonic() - self._opened_at < self.timeout:
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            self.state = CircuitState.HALF_OPEN
+            self._successes = 0
+        # Half-open: one probe at a time, everything else keeps failing fast
+        if self._probe_in_flight:
+            raise CircuitOpenError(f"{self.name} circuit is half-open (probe in flight)")
+        self._probe_in_flight = True
+    
+    def record_success(self):
+        """Record a successful call."""
+        self._failures = 0
+        if self.state is CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+            self._successes += 1
+            if self._successes >= self.success_threshold:
+                self.state = CircuitState.CLOSED
+                logger.info("%s circuit closed", self.name)
+    
+    def record_failure(self):
+        """Record a failed call, opening the circuit when the threshold is reached."""
+        if self.state is CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+            self._open()
+            return
+        self._failures += 1
+        if self.state is CircuitState.CLOSED and self._failures >= self.failure_threshold:
+            self._open()
+    
+    def release(self):
+        """Release a half-open probe slot for a call that was cancelled before it finished."""
+        if self.state is CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+    
+    def _open(self):
+        self.state = CircuitState.OPEN
+        self._opened_at = _monotonic()
+        self._failures = 0
+        logger.warning("%s circuit opened, failing fast for %.0fs", self.name, self.timeout)
+    
+    def snapshot(self) -> dict:
+        """Current state for health reporting."""
+        return {"name": self.name, "state": self.state.value, "consecutive_failures": self._failures}
@@ -3,24 +3,92 @@ LLM Client - Interface for multiple LLM providers
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from enum import Enum
-from typing import Optional
+from typing import AsyncIterator, Optional
 import httpx
 import os
 import asyncio
+import logging
+import orjson
+import time
 
-# Cerebras SDK (chat completions client)
-try:
-    from cerebras.cloud.sdk import Cerebras
-except ImportError:
-    # Fallback for older/newer SDK layouts; will raise at runtime if actually used
-    Cerebras = None
+from .circuit_breaker import CircuitBreaker
+from .retry import retry
 
-# Google Generative AI SDK
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
+logger = logging.getLogger(__name__)
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def _json_headers(headers: Optional[dict]) -> dict:
+    """Request headers for a body that is pre-encoded with orjson."""
+    return {**headers, **_JSON_CONTENT_TYPE} if headers else _JSON_CONTENT_TYPE
+
+# One pooled HTTP client shared by every HTTP-based provider (keep-alive across calls)
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _build_limits() -> httpx.Limits:
+    """Connection pool limits for the shared client, sized for concurrent agent fan-out."""
+    return httpx.Limits(
+        max_connections=int(os.getenv("HTTPX_MAX_CONNECTIONS", "200")),
+        max_keepalive_connections=int(os.getenv("HTTPX_MAX_KEEPALIVE", "50")),
+        keepalive_expiry=float(os.getenv("HTTPX_KEEPALIVE_EXPIRY", "30"))
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared httpx client, creating it on first use."""
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=_build_limits()
+        )
+    return _shared_http_client
+
+
+# Provider hosts primed by prewarm_http_client(), keyed by the env var that enables them
+_PREWARM_HOSTS = {
+    "OPENROUTER_API_KEY": "https://openrouter.ai/",
+    "GROQ_API_KEY": "https://api.groq.com/",
+    "CEREBRAS_API_KEY": "https://api.cerebras.ai/",
+    "GOOGLE_API_KEY": "https://generativelanguage.googleapis.com/",
+}
+
+
+# Connect bound shared by all providers: an unreachable host should fail in seconds
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "2"))
+
+
+def _provider_timeout(provider: str, default_read: float) -> httpx.Timeout:
+    """Per-provider timeout: shared connect bound, read bound from LLM_<PROVIDER>_READ_TIMEOUT."""
+    read = float(os.getenv(f"LLM_{provider}_READ_TIMEOUT", str(default_read)))
+    return httpx.Timeout(read, connect=LLM_CONNECT_TIMEOUT)
+
+
+async def prewarm_http_client():
+    """Open keep-alive connections to each configured provider so the first request skips the TLS handshake."""
+    # HuggingFace is always the fallback provider
+    hosts = ["https://api-inference.huggingface.co/"]
+    hosts.extend(url for env_var, url in _PREWARM_HOSTS.items() if os.getenv(env_var))
+    client = get_http_client()
+    results = await asyncio.gather(
+        *(client.head(url, timeout=10.0) for url in hosts),
+        return_exceptions=True
+    )
+    for url, result in zip(hosts, results):
+        if isinstance(result, Exception):
+            logger.warning("Pre-warm of %s failed: %s", url, result)
+
+
+async def aclose_http_client():
+    """Close the shared httpx client and release its pooled connections."""
+    global _shared_http_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
 
 
 class LLMProvider(Enum):
@@ -36,10 +104,122 @@ class LLMProvider(Enum):
 class LLMClient(ABC):
     """Base class for LLM clients."""
     
+    # Sampling temperature sent with every request
+    temperature: float = 0.7
+    # Request timeout (providers set a tuned httpx.Timeout in __init__)
+    timeout = 60.0
+    # Requests that hit the timeout, reported alongside latency
+    _timeouts: int = 0
+    
+    _breaker: Optional[CircuitBreaker] = None
+    # Rolling window of recent request latencies (seconds); deque(maxlen) evicts the oldest in O(1)
+    _latencies: Optional[deque] = None
+    
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Per-instance circuit breaker guarding this client's provider calls."""
+        if self._breaker is None:
+            self._breaker = CircuitBreaker(type(self).__name__)
+        return self._breaker
+    
+    def latency_stats(self) -> dict:
+        """Average latency over the last 100 provider requests, plus the timeout count."""
+        samples = self._latencies or ()
+        return {
+            "samples": len(samples),
+            "avg_seconds": sum(samples) / len(samples) if samples else 0.0,
+            "timeouts": self._timeouts
+        }
+    
+    async def _post_json(self, url: str, payload: dict, headers: Optional[dict] = None) -> httpx.Response:
+        """POST through the shared client with retries; raises CircuitOpenError while the provider is failing."""
+        breaker = self.breaker
+        breaker.before_call()
+        client = get_http_client()
+        # Encode once with orjson (faster than httpx's stdlib json); retries reuse the bytes
+        content = orjson.dumps(payload)
+        headers = _json_headers(headers)
+        timeout = self.timeout
+        started = time.perf_counter()
+        try:
+            response = await retry(lambda: client.post(url, content=content, headers=headers, timeout=timeout))
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except httpx.TimeoutException:
+            self._timeouts += 1
+            breaker.record_failure()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        if self._latencies is None:
+            self._latencies = deque(maxlen=100)
+        self._latencies.append(time.perf_counter() - started)
+        if response.status_code == 429 or response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+    
     @abstractmethod
     async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
         """Generate a response from the LLM."""
         pass
+    
+    async def stream(self, prompt: str, max_tokens: int = 2000) -> AsyncIterator[str]:
+        """Yield the response in chunks as it is generated (one chunk for providers without streaming)."""
+        yield await self.generate(prompt, max_tokens)
+    
+    async def _stream_lines(self, url: str, payload: dict, headers: Optional[dict] = None) -> AsyncIterator[str]:
+        """Stream a POST response line by line through the shared client, guarded by the circuit breaker."""
+        breaker = self.breaker
+        breaker.before_call()
+        try:
+            async with get_http_client().stream(
+                "POST", url, content=orjson.dumps(payload), headers=_json_headers(headers), timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line:
+                        yield line
+        except httpx.TimeoutException:
+            self._timeouts += 1
+            breaker.record_failure()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled, or the consumer stopped iterating early
+            breaker.release()
+            raise
+        breaker.record_success()
+    
+    async def _stream_chat_completions(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """Stream an OpenAI-style chat completion, yielding content deltas from the SSE `data:` lines."""
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": self.temperature,
+            "stream": True
+        }
+        
+        async for line in self._stream_lines(self.base_url, payload, self._headers()):
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            # Keep reading to the end of the body so the request is recorded as a success
+            if data == "[DONE]":
+                continue
+            choices = orjson.loads(data).get('choices')
+            if choices:
+                content = choices[0].get('delta', {}).get('content')
+                if content:
+                    yield content
 
 
 class HuggingFaceClient(LLMClient):
@@ -49,6 +229,8 @@ class HuggingFaceClient(LLMClient):
         self.api_key = api_key or os.getenv("HUGGINGFACE_API_KEY")
         self.model = model
         self.base_url = "https://api-inference.huggingface.co/models"
+        self.timeout = _provider_timeout("HUGGINGFACE", 60.0)
+        self.free_model_timeout = _provider_timeout("HUGGINGFACE_FREE", 30.0)
     
     async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
         """Generate using Hugging Face API."""
@@ -66,95 +248,105 @@ class HuggingFaceClient(LLMClient):
             "inputs": prompt,
             "parameters": {
                 "max_new_tokens": max_tokens,
-                "temperature": 0.7,
+                "temperature": self.temperature,
                 "return_full_text": False
             }
         }
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-                
-                # Handle different response statuses
-                if response.status_code == 503:
-                    # Model is loading, wait and retry
-                    print(f"Model {self.model} is loading, using fallback")
-                    return await self._generate_free(prompt)
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Handle error responses from HuggingFace
-                if isinstance(result, dict) and "error" in result:
-                    print(f"HuggingFace API error: {result.get('error')}")
-                    return await self._generate_free(prompt)
-                
-                if isinstance(result, list) and len(result) > 0:
-                    generated = result[0].get('generated_text', '')
-                    if generated:
-                        return generated
-                elif isinstance(result, dict):
-                    generated = result.get('generated_text', '')
-                    if generated:
-                        return generated
-                
-                # If no generated text found, try fallback
-                return await self._generate_free(prompt)
-                
-            except httpx.TimeoutException:
-                print("HuggingFace API timeout, using fallback")
-                return await self._generate_free(prompt)
-            except httpx.HTTPStatusError as e:
-                print(f"HuggingFace API HTTP error {e.response.status_code}: {e}")
+        try:
+            response = await self._post_json(url, payload, headers)
+            
+            # Handle different response statuses
+            if response.status_code == 503:
+                # Model is loading, wait and retry
+                logger.warning("Model %s is loading, using fallback", self.model)
                 return await self._generate_free(prompt)
-            except Exception as e:
-                print(f"HuggingFace API error: {e}")
-                # Fallback to free model
+            
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            
+            # Handle error responses from HuggingFace
+            if isinstance(result, dict) and "error" in result:
+                logger.warning("HuggingFace API error: %s", result.get('error'))
                 return await self._generate_free(prompt)
+            
+            if isinstance(result, list) and len(result) > 0:
+                generated = result[0].get('generated_text', '')
+                if generated:
+                    return generated
+            elif isinstance(result, dict):
+                generated = result.get('generated_text', '')
+                if generated:
+                    return generated
+            
+            # If no generated text found, try fallback
+            return await self._generate_free(prompt)
+            
+        except httpx.TimeoutException:
+            logger.warning("HuggingFace API timeout, using fallback")
+            return await self._generate_free(prompt)
+        except httpx.HTTPStatusError as e:
+            logger.warning("HuggingFace API HTTP error %s: %s", e.response.status_code, e)
+            return await self._generate_free(prompt)
+        except Exception as e:
+            logger.warning("HuggingFace API error: %s", e)
+            # Fallback to free model
+            return await self._generate_free(prompt)
     
     async def _generate_free(self, prompt: str) -> str:
         """Use a free model that doesn't require authentication."""
-        # Try multiple free models that work without auth
+        # Query multiple free models that work without auth at once; the first usable answer wins
         free_models = [
             "microsoft/DialoGPT-medium",
             "gpt2",
             "distilgpt2"
         ]
         
-        for model in free_models:
-            url = f"https://api-inference.huggingface.co/models/{model}"
-            
-            payload = {
-                "inputs": prompt[:512] if model == "microsoft/DialoGPT-medium" else prompt[:1024],
-                "parameters": {
-                    "max_new_tokens": 500,
-                    "temperature": 0.7,
-                    "return_full_text": False
-                }
-            }
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                try:
-                    response = await client.post(url, json=payload)
-                    if response.status_code == 200:
-                        result = response.json()
-                        if isinstance(result, list) and len(result) > 0:
-                            generated = result[0].get('generated_text', '')
-                            if generated:
-                                return generated
-                        elif isinstance(result, dict):
-                            generated = result.get('generated_text', '')
-                            if generated:
-                                return generated
-                except Exception as e:
-                    print(f"Error with model {model}: {e}")
-                    continue
+        pending = {asyncio.create_task(self._try_free_model(model, prompt)) for model in free_models}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    generated = task.result()
+                    if generated:
+                        return generated
+        finally:
+            for task in pending:
+                task.cancel()
         
         # Ultimate fallback: return a mock structured response
         # This ensures the system doesn't crash but warns the user
         return """[
   {"id": 1, "name": "Sample Factor", "description": "This is a placeholder response. Please configure an LLM API key for full functionality."}
 ]"""
+    
+    async def _try_free_model(self, model: str, prompt: str) -> Optional[str]:
+        """Query one free model; returns None if it fails or produces no text."""
+        url = f"https://api-inference.huggingface.co/models/{model}"
+        
+        payload = {
+            "inputs": prompt[:512] if model == "microsoft/DialoGPT-medium" else prompt[:1024],
+            "parameters": {
+                "max_new_tokens": 500,
+                "temperature": self.temperature,
+                "return_full_text": False
+            }
+        }
+        
+        client = get_http_client()
+        try:
+            response = await client.post(
+                url, content=orjson.dumps(payload), headers=_JSON_CONTENT_TYPE, timeout=self.free_model_timeout
+            )
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                if isinstance(result, list) and len(result) > 0:
+                    return result[0].get('generated_text', '') or None
+                elif isinstance(result, dict):
+                    return result.get('generated_text', '') or None
+        except Exception as e:
+            logger.warning("Error with model %s: %s", model, e)
+        return None
 
 
 class OpenRouterClient(LLMClient):
@@ -164,18 +356,22 @@ class OpenRouterClient(LLMClient):
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         self.model = model
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.timeout = _provider_timeout("OPENROUTER", 60.0)
     
-    async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
-        """Generate using OpenRouter API."""
+    def _headers(self) -> dict:
         if not self.api_key:
             raise ValueError("OpenRouter API key required. Set OPENROUTER_API_KEY environment variable.")
         
-        headers = {
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/project-aether",
             "X-Title": "Project AETHER"
         }
+    
+    async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
+        """Generate using OpenRouter API."""
+        headers = self._headers()
         
         payload = {
             "model": self.model,
@@ -183,15 +379,18 @@ class OpenRouterClient(LLMClient):
                 {"role": "user", "content": prompt}
             ],
             "max_tokens": max_tokens,
-            "temperature": 0.7
+            "temperature": self.temperature
         }
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(self.base_url, json=payload, headers=headers)
-            response.raise_for_status()
-            result = response.json()
-            
-            return result['choices'][0]['message']['content']
+        response = await self._post_json(self.base_url, payload, headers)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        
+        return result['choices'][0]['message']['content']
+    
+    def stream(self, prompt: str, max_tokens: int = 2000) -> AsyncIterator[str]:
+        """Stream using OpenRouter's SSE chat completions."""
+        return self._stream_chat_completions(prompt, max_tokens)
 
 
 class OllamaClient(LLMClient):
@@ -200,6 +399,8 @@ class OllamaClient(LLMClient):
     def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama2"):
         self.base_url = base_url
         self.model = model
+        # Local models can be slow to produce a long answer
+        self.timeout = _provider_timeout("OLLAMA", 120.0)
     
     async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
         """Generate using local Ollama."""
@@ -211,93 +412,120 @@ class OllamaClient(LLMClient):
             "stream": False,
             "options": {
                 "num_predict": max_tokens,
-                "temperature": 0.7
+                "temperature": self.temperature
             }
         }
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                result = response.json()
-                return result.get('response', '')
-            except Exception as e:
-                return f"[Ollama Error: {str(e)}]"
+        try:
+            response = await self._post_json(url, payload)
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            return result.get('response', '')
+        except Exception as e:
+            return f"[Ollama Error: {str(e)}]"
+    
+    async def stream(self, prompt: str, max_tokens: int = 2000) -> AsyncIterator[str]:
+        """Stream using Ollama's newline-delimited JSON responses."""
+        url = f"{self.base_url}/api/generate"
+        
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": self.temperature
+            }
+        }
+        
+        async for line in self._stream_lines(url, payload):
+            chunk = orjson.loads(line)
+            if chunk.get('response'):
+                yield chunk['response']
 
 
 class CerebrasClient(LLMClient):
-    """Cerebras Inference API client (via cerebras-cloud-sdk)."""
+    """Cerebras Inference API client (OpenAI-compatible chat completions)."""
     
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         # Read config from env with sensible defaults
-        if Cerebras is None:
-            raise ImportError(
-                "Cerebras SDK not available. Install with 'pip install cerebras-cloud-sdk' "
-                "and ensure the version supports 'from cerebras.cloud.sdk import Cerebras'."
-            )
-
         self.api_key = api_key or os.getenv("CEREBRAS_API_KEY")
         if not self.api_key:
             raise ValueError("Cerebras API key required. Set CEREBRAS_API_KEY environment variable.")
         
         # Default to a common, reasonably small model if none is provided
         self.model = model or os.getenv("CEREBRAS_MODEL", "llama3.1-8b")
-        # Initialize Cerebras SDK client (sync client)
-        self.client = Cerebras(api_key=self.api_key)
+        self.base_url = "https://api.cerebras.ai/v1/chat/completions"
+        self.timeout = _provider_timeout("CEREBRAS", 15.0)
+    
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
     
     async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
-        """Generate using Cerebras chat completions (run sync client in a thread)."""
+        """Generate using Cerebras chat completions."""
+        headers = self._headers()
         
-        def _call_cerebras():
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=max_tokens,
-                temperature=0.7,
-            )
-            # Response is OpenAI-style; extract the first choice content
-            return response.choices[0].message.content
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": self.temperature
+        }
         
         try:
-            return await asyncio.to_thread(_call_cerebras)
+            response = await self._post_json(self.base_url, payload, headers)
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            # Response is OpenAI-style; extract the first choice content
+            return result['choices'][0]['message']['content']
         except Exception as e:
             return f"[Cerebras Error: {str(e)}]"
+    
+    def stream(self, prompt: str, max_tokens: int = 2000) -> AsyncIterator[str]:
+        """Stream using Cerebras SSE chat completions."""
+        return self._stream_chat_completions(prompt, max_tokens)
 
 
 class GoogleClient(LLMClient):
-    """Google Gemini API client."""
+    """Google Gemini API client (generateContent REST endpoint)."""
     
     def __init__(self, api_key: Optional[str] = None, model: str = "gemini-pro"):
-        if genai is None:
-            raise ImportError(
-                "Google Generative AI SDK not available. Install with 'pip install google-generativeai'"
-            )
-        
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
             raise ValueError("Google API key required. Set GOOGLE_API_KEY environment variable.")
         
         self.model_name = model
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(self.model_name)
+        self.base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+        self.timeout = _provider_timeout("GOOGLE", 60.0)
     
     async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
         """Generate using Google Gemini API."""
+        headers = {
+            "x-goog-api-key": self.api_key,
+            "Content-Type": "application/json"
+        }
         
-        def _call_gemini():
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=max_tokens,
-                    temperature=0.7,
-                )
-            )
-            return response.text
+        payload = {
+            "contents": [
+                {"parts": [{"text": prompt}]}
+            ],
+            "generationConfig": {
+                "maxOutputTokens": max_tokens,
+                "temperature": self.temperature
+            }
+        }
         
         try:
-            return await asyncio.to_thread(_call_gemini)
+            response = await self._post_json(self.base_url, payload, headers)
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            parts = result['candidates'][0]['content']['parts']
+            return "".join(part.get('text', '') for part in parts)
         except Exception as e:
             return f"[Google Gemini Error: {str(e)}]"
 
@@ -312,13 +540,17 @@ class GroqClient(LLMClient):
         
         self.model = model
         self.base_url = "https://api.groq.com/openai/v1/chat/completions"
+        self.timeout = _provider_timeout("GROQ", 15.0)
     
-    async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
-        """Generate using Groq API."""
-        headers = {
+    def _headers(self) -> dict:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+    
+    async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
+        """Generate using Groq API."""
+        headers = self._headers()
         
         payload = {
             "model": self.model,
@@ -326,32 +558,44 @@ class GroqClient(LLMClient):
                 {"role": "user", "content": prompt}
             ],
             "max_tokens": max_tokens,
-            "temperature": 0.7
+            "temperature": self.temperature
         }
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                response = await client.post(self.base_url, json=payload, headers=headers)
-                response.raise_for_status()
-                result = response.json()
-                return result['choices'][0]['message']['content']
-            except Exception as e:
-                return f"[Groq Error: {str(e)}]"
+        try:
+            response = await self._post_json(self.base_url, payload, headers)
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            return result['choices'][0]['message']['content']
+        except Exception as e:
+            return f"[Groq Error: {str(e)}]"
+    
+    def stream(self, prompt: str, max_tokens: int = 2000) -> AsyncIterator[str]:
+        """Stream using Groq SSE chat completions."""
+        return self._stream_chat_completions(prompt, max_tokens)
 
 
 def create_llm_client(provider: LLMProvider = LLMProvider.HUGGINGFACE, **kwargs) -> LLMClient:
-    """Factory function to create LLM client."""
+    """Factory function to create LLM client (wrapped in a response cache when LLM_CACHE=1)."""
     if provider == LLMProvider.HUGGINGFACE:
-        return HuggingFaceClient(**kwargs)
+        client = HuggingFaceClient(**kwargs)
     elif provider == LLMProvider.OPENROUTER:
-        return OpenRouterClient(**kwargs)
+        client = OpenRouterClient(**kwargs)
     elif provider == LLMProvider.OLLAMA:
-        return OllamaClient(**kwargs)
+        client = OllamaClient(**kwargs)
     elif provider == LLMProvider.CEREBRAS:
-        return CerebrasClient(**kwargs)
+        client = CerebrasClient(**kwargs)
     elif provider == LLMProvider.GOOGLE:
-        return GoogleClient(**kwargs)
+        client = GoogleClient(**kwargs)
     elif provider == LLMProvider.GROQ:
-        return GroqClient(**kwargs)
+        client = GroqClient(**kwargs)
     else:
         raise ValueError(f"Unknown provider: {provider}")
+    
+    if os.getenv("LLM_CACHE") == "1":
+        from .cache import CachedLLMClient
+        force = os.getenv("LLM_CACHE_FORCE") == "1"
+        if not force:
+            # Cached agent calls are made deterministic so a cache hit matches a fresh call
+            client.temperature = 0.0
+        client = CachedLLMClient(client, ttl=float(os.getenv("LLM_CACHE_TTL", "3600")), force=force)
+    return client
@@ -0,0 +1,56 @@
+"""
+Retry - Bounded retries with exponential backoff and jitter for transient provider errors
+"""
+
+from typing import Awaitable, Callable
+import asyncio
+import logging
+import random
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: timeout, rate limit, and transient server/gateway errors
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+# Connection-phase failures that are cheap to retry (read timeouts are not: they already waited)
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+
+# Process-wide counters, reported by the API's metrics endpoint
+retry_counters = {"retries": 0, "recovered": 0, "exhausted": 0}
+
+
+def _backoff(attempt: int, base: float, cap: float, jitter: float) -> float:
+    """Exponential delay for the given (1-based) attempt, capped and spread by +/- jitter."""
+    delay = min(cap, base * (2 ** (attempt - 1)))
+    return delay * (1 + random.uniform(-jitter, jitter))
+
+
+async def retry(fn: Callable[[], Awaitable[httpx.Response]], *, max_attempts: int = 3,
+                base: float = 0.5, cap: float = 8.0, jitter: float = 0.1) -> httpx.Response:
+    """Call fn until it returns a non-retryable response or attempts run out; the last response is returned."""
+    for attempt in range(1, max_attempts + 1):
+        last_attempt = attempt == max_attempts
+        try:
+            response = await fn()
+        except RETRYABLE_ERRORS as e:
+            if last_attempt:
+                retry_counters["exhausted"] += 1
+                raise
+            logger.warning("Transient error %s (attempt %d/%d), retrying", e, attempt, max_attempts)
+            delay = _backoff(attempt, base, cap, jitter)
+        else:
+            if response.status_code not in RETRYABLE_STATUSES:
+                if attempt > 1:
+                    retry_counters["recovered"] += 1
+                return response
+            if last_attempt:
+                retry_counters["exhausted"] += 1
+                return response
+            logger.warning("Transient HTTP %d (attempt %d/%d), retrying", response.status_code, attempt, max_attempts)
+            delay = _backoff(attempt, base, cap, jitter)
+            # Honour a server-provided Retry-After (seconds) within the cap
+            retry_after = response.headers.get("retry-after")
+            if retry_after and retry_after.isdigit():
+                delay = min(cap, max(delay, float(retry_after)))
+        retry_counters["retries"] += 1
+        await asyncio.sleep(delay)
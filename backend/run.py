@@ -11,6 +11,18 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+
+def _event_loop() -> str:
+    """uvloop where it's installed (it doesn't support Windows), otherwise the stock asyncio loop."""
+    if sys.platform == "win32":
+        return "asyncio"
+    try:
+        import uvloop
+    except ImportError:
+        return "asyncio"
+    return "uvloop"
+
+
 if __name__ == "__main__":
     # Set default port
     port = int(os.getenv("PORT", 8000))
@@ -18,12 +30,20 @@ if __name__ == "__main__":
     # Can still override with HOST env var if needed
     default_host = "127.0.0.1" if sys.platform == "win32" else "0.0.0.0"
     host = os.getenv("HOST", default_host)
+    loop = _event_loop()
     
     print("=" * 50)
     print("⚡ PROJECT AETHER - Starting Server")
     print("=" * 50)
     print(f"Server will run on http://{host}:{port}")
     print(f"LLM Provider: {os.getenv('LLM_PROVIDER', 'huggingface')}")
+    print(f"Event loop: {loop}")
+    print(
+        "HTTP pool: "
+        f"max_connections={os.getenv('HTTPX_MAX_CONNECTIONS', '200')}, "
+        f"max_keepalive={os.getenv('HTTPX_MAX_KEEPALIVE', '50')}, "
+        f"keepalive_expiry={os.getenv('HTTPX_KEEPALIVE_EXPIRY', '30')}s"
+    )
     print("=" * 50)
     
     try:
@@ -32,6 +52,10 @@ if __name__ == "__main__":
             host=host,
             port=port,
             reload=False,  # Disabled reload to prevent issues
+            # All agents share one in-process app (message bus, orchestrator pool, LLM
+            # connection pool, caches, history writer); don't let WEB_CONCURRENCY fork copies
+            workers=1,
+            loop=loop,
             log_level="info"
         )
     except OSError as e:
@@ -0,0 +1,135 @@
+"""
+Unit tests for the LLM response cache
+"""
+
+import asyncio
+
+import pytest
+
+from llm.cache import CachedLLMClient, MemoryCacheBackend
+from llm.llm_client import LLMClient
+
+
+class FakeClient(LLMClient):
+    """Counts provider calls and answers with a fixed (or numbered) response."""
+    
+    def __init__(self, response: str = None, temperature: float = 0.0):
+        self.response = response
+        self.temperature = temperature
+        self.model = "fake-model"
+        self.calls = 0
+    
+    async def generate(self, prompt: str, max_tokens: int = 2000) -> str:
+        self.calls += 1
+        return self.response if self.response is not None else f"{prompt}:{self.calls}"
+
+
+def test_backend_expires_entries_after_ttl(clock):
+    backend = MemoryCacheBackend()
+    backend.set("k", "v", ttl=10)
+    clock[0] += 9.9
+    assert backend.get("k") == "v"
+    clock[0] += 0.1
+    assert backend.get("k") is None
+
+
+def test_backend_evicts_least_recently_used(clock):
+    backend = MemoryCacheBackend(maxsize=2)
+    backend.set("a", "1", ttl=10)
+    backend.set("b", "2", ttl=10)
+    # Reading "a" makes "b" the least recently used entry
+    assert backend.get("a") == "1"
+    backend.set("c", "3", ttl=10)
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    assert backend.get("c") == "3"
+
+
+def test_backend_overwrite_refreshes_entry(clock):
+    backend = MemoryCacheBackend(maxsize=2)
+    backend.set("a", "1", ttl=10)
+    backend.set("b", "2", ttl=10)
+    backend.set("a", "new", ttl=10)
+    backend.set("c", "3", ttl=10)
+    assert backend.get("a") == "new"
+    assert backend.get("b") is None
+
+
+def test_repeated_prompt_hits_cache(clock):
+    inner = FakeClient()
+    client = CachedLLMClient(inner)
+    
+    async def run():
+        return [await client.generate("p", 100) for _ in range(3)]
+    
+    assert asyncio.run(run()) == ["p:1", "p:1", "p:1"]
+    assert inner.calls == 1
+    assert client.stats() == {"exact_hits": 2, "misses": 1, "hit_rate": 2 / 3}
+
+
+def test_key_includes_max_tokens_and_temperature(clock):
+    inner = FakeClient()
+    client = CachedLLMClient(inner, force=True)
+    
+    async def run():
+        await client.generate("p", 100)
+        await client.generate("p", 200)
+        inner.temperature = 0.5
+        await client.generate("p", 100)
+    
+    asyncio.run(run())
+    assert inner.calls == 3
+
+
+def test_expired_response_is_regenerated(clock):
+    inner = FakeClient()
+    client = CachedLLMClient(inner, ttl=60)
+    
+    async def run():
+        await client.generate("p")
+        clock[0] += 60
+        return await client.generate("p")
+    
+    assert asyncio.run(run()) == "p:2"
+    assert inner.calls == 2
+
+
+@pytest.mark.parametrize("response", ["[OpenRouter Error: 502 Bad Gateway]", ""])
+def test_error_and_empty_responses_are_not_cached(clock, response):
+    inner = FakeClient(response=response)
+    client = CachedLLMClient(inner)
+    
+    async def run():
+        await client.generate("p")
+        await client.generate("p")
+    
+    asyncio.run(run())
+    assert inner.calls == 2
+    assert client.hits == 0
+
+
+def test_bracketed_answer_is_still_cached(clock):
+    inner = FakeClient(response="[1] First point")
+    client = CachedLLMClient(inner)
+    
+    async def run():
+        await client.generate("p")
+        await client.generate("p")
+    
+    asyncio.run(run())
+    assert inner.calls == 1
+
+
+def test_sampled_calls_bypass_cache_unless_forced(clock):
+    inner = FakeClient(temperature=0.7)
+    
+    async def run(client):
+        await client.generate("p")
+        await client.generate("p")
+    
+    asyncio.run(run(CachedLLMClient(inner)))
+    assert inner.calls == 2
+    
+    inner.calls = 0
+    asyncio.run(run(CachedLLMClient(inner, force=True)))
+    assert inner.calls == 1
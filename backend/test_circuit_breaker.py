@@ -0,0 +1,90 @@
+"""
+Unit tests for the provider circuit breaker
+"""
+
+import pytest
+
+from llm.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+def _open_breaker(breaker: CircuitBreaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, timeout=10)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, timeout=10)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 1
+
+
+def test_half_open_admits_one_probe_after_timeout(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, timeout=10)
+    _open_breaker(breaker)
+    
+    clock[0] += 9.9
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    
+    clock[0] += 0.1
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+    # A second caller fails fast while the probe is in flight
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_closes_after_success_threshold(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, timeout=10, success_threshold=2)
+    _open_breaker(breaker)
+    clock[0] += 10
+    
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, timeout=10)
+    _open_breaker(breaker)
+    clock[0] += 10
+    
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    # The cool-down restarts from the failed probe
+    clock[0] += 5
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_release_frees_probe_slot(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, timeout=10)
+    _open_breaker(breaker)
+    clock[0] += 10
+    
+    breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
@@ -0,0 +1,67 @@
+"""
+Unit tests for the coordination clock
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from coordination import clock
+from coordination.clock import Timestamp, now_iso
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@pytest.fixture
+def time_ns(monkeypatch):
+    """Controllable time.time_ns, with the formatted-prefix cache cleared."""
+    now = [0]
+    monkeypatch.setattr(clock.time, "time_ns", lambda: now[0])
+    monkeypatch.setattr(clock, "_now_iso_cache", (-1, ""))
+    return now
+
+
+def _expected(ns: int) -> str:
+    """What datetime.utcnow().isoformat() gives for this instant."""
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat()
+
+
+@pytest.mark.parametrize("ns", [
+    1_700_000_000_123_456_789,
+    1_700_000_000_000_001_000,
+    1_700_000_000_999_999_999,
+    # Whole second: isoformat() drops the fraction
+    1_700_000_000_000_000_000,
+    # Sub-microsecond remainder still counts as a whole second
+    1_700_000_000_000_000_999,
+    0,
+    951_782_400_500_000_000
+])
+def test_matches_isoformat(time_ns, ns):
+    time_ns[0] = ns
+    assert now_iso() == _expected(ns)
+
+
+def test_prefix_follows_second_changes(time_ns):
+    # Forward across seconds, within a second, and backwards (clock adjustments)
+    for ns in (
+        1_700_000_000_100_000_000,
+        1_700_000_000_900_000_000,
+        1_700_000_001_000_000_000,
+        1_700_000_061_250_000_000,
+        1_699_999_999_500_000_000
+    ):
+        time_ns[0] = ns
+        assert now_iso() == _expected(ns)
+
+
+def test_matches_utcnow_shape():
+    value = now_iso()
+    parsed = datetime.fromisoformat(value)
+    assert abs(parsed - datetime.utcnow()) < timedelta(seconds=5)
+    assert len(value) in (19, 26)
+
+
+@pytest.mark.parametrize("seconds", [1_700_000_000.123456, 1_700_000_000.0, 0.0])
+def test_timestamp_isoformat_matches_utc(seconds):
+    assert Timestamp(seconds).isoformat() == (_EPOCH + timedelta(seconds=seconds)).isoformat()
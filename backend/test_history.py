@@ -0,0 +1,113 @@
+"""
+Unit tests for history storage
+"""
+
+import asyncio
+import os
+import sqlite3
+import sys
+
+# Add parent directory to path (once)
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from storage.history import HistoryStorage
+
+
+def make_result(name: str) -> dict:
+    return {
+        "factors": [{"id": 1, "name": name}],
+        "final_report": {"report": f"Report for {name}"}
+    }
+
+
+def test_awaited_save_is_readable_on_return(tmp_path):
+    storage = HistoryStorage(str(tmp_path / "history.db"))
+    
+    async def run():
+        analysis_id = storage.reserve_id()
+        await storage.save_analysis_async(analysis_id, make_result("alpha"))
+        return analysis_id
+    
+    analysis_id = asyncio.run(run())
+    
+    analysis = storage.get_analysis(analysis_id)
+    assert analysis["final_report"] == "Report for alpha"
+    assert analysis["key_points"] == ["Factor: alpha"]
+
+
+def test_failing_row_does_not_take_down_its_batch(tmp_path):
+    storage = HistoryStorage(str(tmp_path / "history.db"))
+    # Occupy an ID so re-inserting it in the batch violates the primary key
+    taken_id = storage.save_analysis(make_result("existing"))
+    
+    async def run():
+        good_id = storage.reserve_id()
+        queued_id = storage.reserve_id()
+        storage.enqueue_analysis(queued_id, make_result("queued"))
+        # Queued within one batch window, so all three rows share a transaction
+        outcomes = await asyncio.gather(
+            storage.save_analysis_async(taken_id, make_result("duplicate")),
+            storage.save_analysis_async(good_id, make_result("good")),
+            return_exceptions=True
+        )
+        await storage.flush()
+        return good_id, queued_id, outcomes
+    
+    good_id, queued_id, outcomes = asyncio.run(run())
+    
+    assert isinstance(outcomes[0], sqlite3.IntegrityError)
+    assert outcomes[1] == good_id
+    assert storage.get_analysis(good_id)["final_report"] == "Report for good"
+    assert storage.get_analysis(queued_id)["final_report"] == "Report for queued"
+    # The existing row is left untouched
+    assert storage.get_analysis(taken_id)["final_report"] == "Report for existing"
+
+
+
+def test_key_points_are_stored_as_blobs(tmp_path):
+    db_path = str(tmp_path / "history.db")
+    storage = HistoryStorage(db_path)
+    analysis_id = storage.save_analysis(make_result("alpha"))
+    
+    with sqlite3.connect(db_path) as conn:
+        stored = conn.execute(
+            "SELECT typeof(key_points_json), key_points FROM analyses WHERE id = ?", (analysis_id,)
+        ).fetchone()
+    
+    assert stored == ("blob", None)
+    assert storage.get_history()[0]["key_points"] == ["Factor: alpha"]
+
+
+def test_legacy_key_points_are_migrated(tmp_path):
+    db_path = str(tmp_path / "history.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE analyses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                input_preview TEXT,
+                factors_count INTEGER,
+                final_report TEXT,
+                key_points TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        # Older rows hold JSON text; rows written before the BLOB column hold orjson bytes
+        conn.execute(
+            "INSERT INTO analyses (id, timestamp, final_report, key_points) VALUES (1, 't', 'one', ?)",
+            ('["Factor: text"]',)
+        )
+        conn.execute(
+            "INSERT INTO analyses (id, timestamp, final_report, key_points) VALUES (2, 't', 'two', ?)",
+            (b'["Factor: bytes"]',)
+        )
+        conn.execute("INSERT INTO analyses (id, timestamp, final_report) VALUES (3, 't', 'three')")
+    
+    storage = HistoryStorage(db_path)
+    
+    assert storage.get_analysis(1)["key_points"] == ["Factor: text"]
+    assert storage.get_analysis(2)["key_points"] == ["Factor: bytes"]
+    assert storage.get_analysis(3)["key_points"] == []
+    assert storage.reserve_id() == 4
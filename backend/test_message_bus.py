@@ -0,0 +1,230 @@
+"""
+Unit tests for the coordination message bus
+"""
+
+import asyncio
+
+from coordination.message_bus import MessageBus, MessageType
+
+FACTOR_LIST = MessageType.FACTOR_LIST.value
+FACTOR_DISCOVERED = MessageType.FACTOR_DISCOVERED.value
+SUPPORT_ARGUMENT = MessageType.SUPPORT_ARGUMENT.value
+CRITIQUE = MessageType.CRITIQUE.value
+
+
+def factor_list(count: int) -> dict:
+    return {
+        "type": FACTOR_LIST,
+        "factors": [{"id": factor_id, "name": f"Factor {factor_id}"} for factor_id in range(1, count + 1)]
+    }
+
+
+def test_messages_are_recorded_in_publish_order():
+    bus = MessageBus()
+    
+    async def run():
+        await bus.publish({"type": SUPPORT_ARGUMENT, "factor_id": 1}, agent_id="support")
+        await bus.publish({"type": CRITIQUE, "factor_id": 1}, agent_id="critic")
+    
+    asyncio.run(run())
+    
+    messages = bus.get_all_messages()
+    assert [m["type"] for m in messages] == [SUPPORT_ARGUMENT, CRITIQUE]
+    assert [m["id"] for m in messages] == ["msg_0", "msg_1"]
+    assert [m["publisher"] for m in messages] == ["support", "critic"]
+    assert all("timestamp" in m for m in messages)
+
+
+def test_factor_list_records_every_factor_event_before_notifying():
+    bus = MessageBus()
+    seen = []
+    
+    async def on_factor(message):
+        # Every FACTOR_DISCOVERED event is already in the log when the first handler runs
+        seen.append((message["factor_id"], len(bus.get_messages_by_type(MessageType.FACTOR_DISCOVERED))))
+    
+    bus.subscribe(FACTOR_DISCOVERED, on_factor)
+    asyncio.run(bus.publish(factor_list(3), agent_id="factor"))
+    
+    assert sorted(seen) == [(1, 3), (2, 3), (3, 3)]
+    assert [m["type"] for m in bus.get_all_messages()] == [FACTOR_LIST] + [FACTOR_DISCOVERED] * 3
+    assert bus.get_factor(2)["name"] == "Factor 2"
+
+
+def test_handlers_fire_in_subscription_order():
+    bus = MessageBus()
+    calls = []
+    
+    def make_handler(name):
+        async def handler(message):
+            calls.append(name)
+        return handler
+    
+    for name in ("first", "second", "third"):
+        bus.subscribe(CRITIQUE, make_handler(name))
+    asyncio.run(bus.publish({"type": CRITIQUE}))
+    
+    assert calls == ["first", "second", "third"]
+
+
+def test_single_handler_is_awaited_inline():
+    bus = MessageBus()
+    handler_tasks = []
+    
+    async def handler(message):
+        handler_tasks.append(asyncio.current_task())
+    
+    bus.subscribe(CRITIQUE, handler)
+    
+    async def run():
+        await bus.publish({"type": CRITIQUE})
+        return asyncio.current_task()
+    
+    publisher_task = asyncio.run(run())
+    
+    assert handler_tasks == [publisher_task]
+
+
+def test_handler_errors_are_swallowed():
+    bus = MessageBus()
+    calls = []
+    
+    def failing_sync(message):
+        raise RuntimeError("sync boom")
+    
+    async def failing_async(message):
+        raise RuntimeError("async boom")
+    
+    async def healthy(message):
+        calls.append(message["type"])
+    
+    bus.subscribe(CRITIQUE, failing_sync)
+    bus.subscribe(CRITIQUE, failing_async)
+    bus.subscribe(CRITIQUE, healthy)
+    bus.subscribe(SUPPORT_ARGUMENT, failing_async)
+    
+    async def run():
+        await bus.publish({"type": CRITIQUE})
+        # Single-handler inline path
+        await bus.publish({"type": SUPPORT_ARGUMENT})
+    
+    asyncio.run(run())
+    
+    assert calls == [CRITIQUE]
+    assert len(bus.get_all_messages()) == 2
+
+
+def test_factor_fan_out_is_bounded():
+    bus = MessageBus(max_concurrent_factors=2)
+    in_flight = 0
+    peak = 0
+    handled = []
+    
+    async def on_factor(message):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        handled.append(message["factor_id"])
+    
+    bus.subscribe(FACTOR_DISCOVERED, on_factor)
+    asyncio.run(bus.publish(factor_list(5)))
+    
+    assert peak == 2
+    assert sorted(handled) == [1, 2, 3, 4, 5]
+
+
+def test_unsubscribe_during_delivery_takes_effect_on_the_next_publish():
+    bus = MessageBus()
+    calls = []
+    
+    def unsubscriber(message):
+        calls.append("unsubscriber")
+        bus.unsubscribe(CRITIQUE, victim)
+    
+    def victim(message):
+        calls.append("victim")
+    
+    bus.subscribe(CRITIQUE, unsubscriber)
+    bus.subscribe(CRITIQUE, victim)
+    
+    async def run():
+        await bus.publish({"type": CRITIQUE})
+        await bus.publish({"type": CRITIQUE})
+    
+    asyncio.run(run())
+    
+    # The in-progress delivery iterates a snapshot, so the victim still sees the first message
+    assert calls == ["unsubscriber", "victim", "unsubscriber"]
+
+
+def test_unsubscribe_unknown_handler_is_a_no_op():
+    bus = MessageBus()
+    bus.unsubscribe(CRITIQUE, print)
+    bus.subscribe(CRITIQUE, len)
+    bus.unsubscribe(CRITIQUE, print)
+    assert bus._handler_snapshots[CRITIQUE] == ((len, False),)
+
+
+def test_type_and_factor_indexes():
+    bus = MessageBus()
+    
+    async def run():
+        await bus.publish(factor_list(2))
+        await bus.publish({"type": SUPPORT_ARGUMENT, "factor_id": 1, "argument": "old"})
+        await bus.publish({"type": SUPPORT_ARGUMENT, "factor_id": 1, "argument": "new"})
+        await bus.publish({"type": CRITIQUE, "factor_id": 2})
+    
+    asyncio.run(run())
+    
+    supports = bus.get_messages_by_type(MessageType.SUPPORT_ARGUMENT)
+    assert [m["argument"] for m in supports] == ["old", "new"]
+    # Callers get a copy of the index
+    supports.clear()
+    assert len(bus.get_messages_by_type(MessageType.SUPPORT_ARGUMENT)) == 2
+    
+    summary = bus.get_debate_summary()
+    assert summary[1]["support"]["argument"] == "new"
+    assert summary[1]["critique"] is None
+    assert summary[1]["debate_rounds"] == 2
+    assert summary[2]["critique"]["factor_id"] == 2
+    assert summary[2]["debate_rounds"] == 1
+
+
+def test_handled_by_is_tracked_per_agent():
+    bus = MessageBus()
+    bus.mark_handled("msg_0", "support")
+    bus.mark_handled("msg_0", "critic")
+    bus.mark_handled("msg_1", "critic")
+    
+    assert bus.is_handled_by("msg_0", "support")
+    assert bus.is_handled_by("msg_0", "critic")
+    assert not bus.is_handled_by("msg_1", "support")
+    assert not bus.is_handled_by("msg_0", "synthesizer")
+
+
+def test_clear_resets_log_indexes_and_handled_bitsets():
+    bus = MessageBus()
+    
+    async def run():
+        await bus.publish(factor_list(2))
+        await bus.publish({"type": SUPPORT_ARGUMENT, "factor_id": 1})
+    
+    asyncio.run(run())
+    bus.mark_handled("msg_0", "support")
+    
+    bus.clear()
+    
+    assert bus.get_all_messages() == []
+    assert bus.get_factors() == []
+    assert bus.get_factor(1) is None
+    assert bus.get_messages_by_type(MessageType.SUPPORT_ARGUMENT) == []
+    assert bus.get_debate_summary() == {}
+    assert not bus._by_factor
+    assert not bus.is_handled_by("msg_0", "support")
+    assert bus._handled_by == {} and bus._agent_bits == {}
+    
+    # Agent bits are handed out afresh after a clear
+    bus.mark_handled("msg_0", "critic")
+    assert bus._agent_bits == {"critic": 1}
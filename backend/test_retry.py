@@ -0,0 +1,122 @@
+"""
+Unit tests for provider call retries
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from llm import retry as retry_module
+from llm.retry import _backoff, retry, retry_counters
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record requested backoff delays instead of sleeping."""
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    """Reset the process-wide retry counters for the test."""
+    for name in retry_counters:
+        monkeypatch.setitem(retry_counters, name, 0)
+    return retry_counters
+
+
+def _responses(*items):
+    """An fn for retry() that returns (or raises) the given items in order."""
+    remaining = list(items)
+    calls = []
+    
+    async def fn():
+        calls.append(1)
+        item = remaining.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+    
+    fn.calls = calls
+    return fn
+
+
+def test_backoff_doubles_up_to_cap():
+    assert [_backoff(attempt, 0.5, 3.0, 0) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_backoff_jitter_stays_in_bounds():
+    for _ in range(100):
+        assert 0.9 <= _backoff(1, 1.0, 8.0, 0.1) <= 1.1
+
+
+def test_success_is_not_retried(sleeps, counters):
+    fn = _responses(httpx.Response(200))
+    response = asyncio.run(retry(fn))
+    assert response.status_code == 200
+    assert len(fn.calls) == 1
+    assert sleeps == []
+    assert counters == {"retries": 0, "recovered": 0, "exhausted": 0}
+
+
+def test_non_retryable_status_is_returned(sleeps, counters):
+    fn = _responses(httpx.Response(400))
+    assert asyncio.run(retry(fn)).status_code == 400
+    assert len(fn.calls) == 1
+
+
+def test_retryable_status_recovers(sleeps, counters):
+    fn = _responses(httpx.Response(503), httpx.Response(502), httpx.Response(200))
+    response = asyncio.run(retry(fn, base=0.5, jitter=0))
+    assert response.status_code == 200
+    assert sleeps == [0.5, 1.0]
+    assert counters == {"retries": 2, "recovered": 1, "exhausted": 0}
+
+
+def test_exhausted_returns_last_response(sleeps, counters):
+    fn = _responses(httpx.Response(500), httpx.Response(500), httpx.Response(429))
+    response = asyncio.run(retry(fn, max_attempts=3, jitter=0))
+    assert response.status_code == 429
+    assert len(sleeps) == 2
+    assert counters == {"retries": 2, "recovered": 0, "exhausted": 1}
+
+
+def test_retry_after_is_honoured_within_cap(sleeps, counters):
+    fn = _responses(
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(429, headers={"Retry-After": "60"}),
+        httpx.Response(200)
+    )
+    asyncio.run(retry(fn, base=0.5, cap=8.0, jitter=0))
+    assert sleeps == [3.0, 8.0]
+
+
+def test_non_numeric_retry_after_is_ignored(sleeps, counters):
+    fn = _responses(
+        httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+        httpx.Response(200)
+    )
+    asyncio.run(retry(fn, base=0.5, jitter=0))
+    assert sleeps == [0.5]
+
+
+def test_connect_error_is_retried_then_raised(sleeps, counters):
+    fn = _responses(httpx.ConnectError("down"), httpx.ConnectError("down"))
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(retry(fn, max_attempts=2, jitter=0))
+    assert len(fn.calls) == 2
+    assert counters == {"retries": 1, "recovered": 0, "exhausted": 1}
+
+
+def test_read_timeout_is_not_retried(sleeps, counters):
+    fn = _responses(httpx.ReadTimeout("slow"))
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(retry(fn))
+    assert len(fn.calls) == 1
+    assert sleeps == []
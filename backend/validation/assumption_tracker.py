@@ -3,17 +3,23 @@ Assumption Tracker
 Tracks all assumptions made during analysis.
 """
 
+from collections import defaultdict
+import bisect
 from typing import List, Dict, Optional
-from datetime import datetime
+from coordination.clock import Timestamp
 
 
 class AssumptionTracker:
     """Tracks all assumptions made by agents during analysis."""
     
     def __init__(self):
+        # One record list; the indexes hold references to the same record dicts
         self.assumptions: List[Dict] = []
-        self.assumptions_by_factor: Dict[int, List[Dict]] = {}
-        self.assumptions_by_agent: Dict[str, List[Dict]] = {}
+        self.assumptions_by_factor: Dict[int, List[Dict]] = defaultdict(list)
+        self.assumptions_by_agent: Dict[str, List[Dict]] = defaultdict(list)
+        # Maintained on register so reports don't sort or scan: factor IDs in order, factorless records
+        self._factor_ids: List[int] = []
+        self._general_assumptions: List[Dict] = []
     
     def register_assumption(
         self,
@@ -37,12 +43,9 @@ class AssumptionTracker:
             Assumption record dict or None if factor is rejected
         """
         # Check if factor is rejected - do NOT track assumptions for rejected factors
-        if resolution_tracker and factor_id:
-            from validation.resolution_tracker import ResolutionStatus
-            resolution = resolution_tracker.get_resolution(factor_id)
-            if resolution and resolution['status'] == ResolutionStatus.REJECTED.value:
-                # Do NOT track assumptions for rejected factors
-                return None
+        if resolution_tracker and factor_id in resolution_tracker.rejected_ids:
+            # Do NOT track assumptions for rejected factors
+            return None
         
         assumption_record = {
             'id': len(self.assumptions) + 1,
@@ -50,20 +53,19 @@ class AssumptionTracker:
             'factor_id': factor_id,
             'assumption': assumption,
             'context': context,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': Timestamp.now()  # ISO-formatted lazily at serialization
         }
         
         self.assumptions.append(assumption_record)
         
-        # Index by factor
+        # Index by factor and by agent
         if factor_id is not None:
-            if factor_id not in self.assumptions_by_factor:
-                self.assumptions_by_factor[factor_id] = []
-            self.assumptions_by_factor[factor_id].append(assumption_record)
-        
-        # Index by agent
-        if agent_id not in self.assumptions_by_agent:
-            self.assumptions_by_agent[agent_id] = []
+            factor_assumptions = self.assumptions_by_factor[factor_id]
+            if not factor_assumptions:
+                bisect.insort(self._factor_ids, factor_id)
+            factor_assumptions.append(assumption_record)
+        else:
+            self._general_assumptions.append(assumption_record)
         self.assumptions_by_agent[agent_id].append(assumption_record)
         
         return assumption_record
@@ -77,45 +79,44 @@ class AssumptionTracker:
         return self.assumptions_by_agent.get(agent_id, [])
     
     def get_all_assumptions(self) -> List[Dict]:
-        """Get all assumptions."""
-        return self.assumptions.copy()
+        """Get all assumptions (shared list - callers must not mutate it)."""
+        # clear() rebinds rather than empties the list, so a returned list stays intact
+        return self.assumptions
     
     def get_assumption_audit_report(self) -> str:
         """Generate a human-readable assumption audit report."""
         if not self.assumptions:
             return "=== ASSUMPTIONS AUDIT ===\n\nNo assumptions recorded.\n"
         
-        report = "=== ASSUMPTIONS AUDIT ===\n\n"
-        report += f"Total Assumptions: {len(self.assumptions)}\n\n"
+        # Collect the pieces and join once (repeated += copies the whole report each time)
+        parts = ["=== ASSUMPTIONS AUDIT ===\n\n", f"Total Assumptions: {len(self.assumptions)}\n\n"]
         
         # Group by factor
-        factor_ids = sorted(self.assumptions_by_factor.keys())
-        
-        for factor_id in factor_ids:
-            assumptions = self.assumptions_by_factor[factor_id]
-            report += f"Factor {factor_id}:\n"
-            for i, assumption in enumerate(assumptions, 1):
-                report += f"  {i}. {assumption['assumption']}\n"
-                if assumption['context']:
-                    report += f"     Context: {assumption['context']}\n"
-                report += f"     (by {assumption['agent_id']})\n"
-            report += "\n"
+        for factor_id in self._factor_ids:
+            parts.append(f"Factor {factor_id}:\n")
+            self._append_assumption_lines(parts, self.assumptions_by_factor[factor_id])
         
         # General assumptions (not tied to specific factor)
-        general_assumptions = [a for a in self.assumptions if a['factor_id'] is None]
-        if general_assumptions:
-            report += "General Assumptions:\n"
-            for i, assumption in enumerate(general_assumptions, 1):
-                report += f"  {i}. {assumption['assumption']}\n"
-                if assumption['context']:
-                    report += f"     Context: {assumption['context']}\n"
-                report += f"     (by {assumption['agent_id']})\n"
-            report += "\n"
+        if self._general_assumptions:
+            parts.append("General Assumptions:\n")
+            self._append_assumption_lines(parts, self._general_assumptions)
         
-        return report
+        return "".join(parts)
+    
+    @staticmethod
+    def _append_assumption_lines(parts: List[str], assumptions: List[Dict]):
+        """Append one numbered block per assumption, followed by a blank line."""
+        for i, assumption in enumerate(assumptions, 1):
+            parts.append(f"  {i}. {assumption['assumption']}\n")
+            if assumption['context']:
+                parts.append(f"     Context: {assumption['context']}\n")
+            parts.append(f"     (by {assumption['agent_id']})\n")
+        parts.append("\n")
     
     def clear(self):
         """Clear all assumptions."""
         self.assumptions = []
-        self.assumptions_by_factor = {}
-        self.assumptions_by_agent = {}
+        self.assumptions_by_factor = defaultdict(list)
+        self.assumptions_by_agent = defaultdict(list)
+        self._factor_ids = []
+        self._general_assumptions = []
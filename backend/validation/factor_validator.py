@@ -4,7 +4,7 @@ Validates factors against document content and detects circular reasoning.
 """
 
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 
 class FactorValidator:
@@ -38,13 +38,15 @@ class FactorValidator:
     def __init__(self):
         self.validation_results = []
     
-    def validate_factor_grounding(self, factor: Dict, document: str) -> Tuple[bool, str]:
+    def validate_factor_grounding(self, factor: Dict, document: str,
+                                  document_lower: Optional[str] = None) -> Tuple[bool, str]:
         """
         Validate that a factor is grounded in the document.
         
         Args:
             factor: Factor dict with 'name' and 'description'
             document: Original document text
+            document_lower: document.lower(), if the caller already has it
             
         Returns:
             (is_grounded, validation_note)
@@ -63,7 +65,8 @@ class FactorValidator:
             return False, "Factor name contains no meaningful terms"
         
         # Check if at least 50% of key terms appear in document
-        document_lower = document.lower()
+        if document_lower is None:
+            document_lower = document.lower()
         found_terms = [term for term in key_terms if term in document_lower]
         
         grounding_ratio = len(found_terms) / len(key_terms) if key_terms else 0
@@ -134,8 +137,10 @@ class FactorValidator:
             'factor_validations': []
         }
         
+        # Lowercase the document once for the whole list rather than once per factor
+        document_lower = document.lower()
         for factor in factors:
-            is_grounded, grounding_note = self.validate_factor_grounding(factor, document)
+            is_grounded, grounding_note = self.validate_factor_grounding(factor, document, document_lower)
             is_circular, circular_note = self.detect_circular_reasoning(factor)
             
             is_valid = is_grounded and not is_circular
@@ -4,8 +4,8 @@ Tracks debate resolution status for each factor.
 """
 
 from enum import Enum
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Set
+from coordination.clock import now_iso
 
 
 class ResolutionStatus(Enum):
@@ -21,6 +21,8 @@ class ResolutionTracker:
     
     def __init__(self):
         self.resolutions: Dict[int, Dict] = {}
+        # Factor IDs currently resolved as REJECTED, for O(1) membership checks
+        self._rejected_ids: Set[int] = set()
     
     def set_resolution(
         self,
@@ -52,12 +54,22 @@ class ResolutionTracker:
             'justification': justification,
             'sub_claims': sub_claims or [],
             'critic_agent_id': critic_agent_id,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': now_iso()
         }
         
         self.resolutions[factor_id] = resolution
+        # A later resolution can overturn a rejection, so keep the set in step either way
+        if status is ResolutionStatus.REJECTED:
+            self._rejected_ids.add(factor_id)
+        else:
+            self._rejected_ids.discard(factor_id)
         return resolution
     
+    @property
+    def rejected_ids(self) -> Set[int]:
+        """IDs of factors currently resolved as REJECTED (shared set - callers must not mutate it)."""
+        return self._rejected_ids
+    
     def get_resolution(self, factor_id: int) -> Optional[Dict]:
         """Get the resolution for a specific factor."""
         return self.resolutions.get(factor_id)
@@ -96,7 +108,7 @@ class ResolutionTracker:
     
     def did_critic_win_any_debate(self) -> bool:
         """Check if the critic agent won at least one debate (rejected a factor)."""
-        return len(self.get_rejected_factors()) > 0
+        return bool(self._rejected_ids)
     
     def get_resolution_report(self, factors: List[Dict]) -> str:
         """Generate a human-readable resolution report."""
@@ -137,3 +149,4 @@ class ResolutionTracker:
     def clear(self):
         """Clear all resolutions."""
         self.resolutions = {}
+        self._rejected_ids = set()
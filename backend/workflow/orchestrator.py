@@ -6,6 +6,7 @@ Agents self-deploy and react to events; orchestrator manages lifecycle and timin
 
 from typing import Dict, Optional, Callable
 import asyncio
+import os
 from coordination.message_bus import MessageBus, MessageType
 from coordination.agent_registry import AgentRegistry
 from coordination.role_policy import RolePolicyEngine
@@ -17,6 +18,11 @@ from agents import (
     FinalDecisionAgent
 )
 from llm.llm_client import LLMClient
+from validation import FactorValidator, AssumptionTracker, ResolutionTracker, IntegrityChecker
+
+# Upper bound on factor debates in flight at once, so a long factor list
+# doesn't open one LLM request chain per factor simultaneously
+MAX_CONCURRENT_DEBATES = int(os.getenv("MAX_CONCURRENT_DEBATES", "8"))
 
 
 class Orchestrator:
@@ -25,17 +31,18 @@ class Orchestrator:
     Agents are self-deployed and event-driven; orchestrator manages timing and lifecycle.
     """
     
-    def __init__(self, llm_client: LLMClient):
-        # Initialize coordination layer
-        self.message_bus = MessageBus()
+    def __init__(self, llm_client: LLMClient, policy_engine: Optional[RolePolicyEngine] = None,
+                 factor_validator=None):
+        # Initialize coordination layer; the bus and registry are per session, while the
+        # stateless policy engine and factor validator can be shared between orchestrators
+        self.message_bus = MessageBus(max_concurrent_factors=MAX_CONCURRENT_DEBATES)
         self.registry = AgentRegistry()
-        self.policy_engine = RolePolicyEngine()
+        self.policy_engine = policy_engine or RolePolicyEngine()
         
         self.llm_client = llm_client
         
         # Initialize validation components
-        from validation import FactorValidator, AssumptionTracker, ResolutionTracker, IntegrityChecker
-        self.factor_validator = FactorValidator()
+        self.factor_validator = factor_validator or FactorValidator()
         self.assumption_tracker = AssumptionTracker()
         self.resolution_tracker = ResolutionTracker()
         self.integrity_checker = IntegrityChecker()
@@ -65,6 +72,26 @@ class Orchestrator:
         self.progress_callback: Optional[Callable] = None
         self.current_input_text: str = ""
     
+    def reset(self):
+        """
+        Reset all per-analysis state so this orchestrator can be reused.
+        Agents and their registrations are kept; only session state is dropped.
+        """
+        self.message_bus.clear()
+        self.assumption_tracker.clear()
+        self.resolution_tracker.clear()
+        self.integrity_checker.clear()
+        
+        self.support_agent.claims = {}
+        self.support_agent.rebuttals_issued = {}
+        self.critic_agent.claims = {}
+        self.synthesizer_agent.synthesis_triggered = False
+        
+        for agent in (self.factor_agent, self.support_agent, self.critic_agent, self.synthesizer_agent):
+            agent.current_input_text = ""
+        self.current_input_text = ""
+        self.progress_callback = None
+    
     def set_progress_callback(self, callback: Callable):
         """Set callback for real-time progress updates."""
         self.progress_callback = callback
@@ -120,26 +147,12 @@ class Orchestrator:
             if show_updates:
                 self._notify_progress("debate", "Starting agent debates...")
             
-            # For each factor, orchestrate the debate
-            for factor in factors:
-                factor_id = factor['id']
-                
-                if show_updates:
-                    self._notify_progress("debate", f"Debating factor {factor_id}: {factor['name']}")
-                
-                # Step 2a: Supporting agent generates support
-                support = await self.support_agent.support_factor(factor, input_text)
-                
-                # Step 2b: Critic agent generates critique
-                critique = await self.critic_agent.critique_factor(factor, support, input_text)
-                
-                # Step 2c: Supporting agent may issue rebuttal
-                if critique and critique.get('resolution') != 'ACCEPTED':
-                    rebuttal = await self.support_agent.rebut(factor_id, critique, input_text)
-                    
-                    if show_updates:
-                        resolution = critique.get('resolution', 'UNKNOWN')
-                        self._notify_progress("debate", f"Factor {factor_id} resolved: {resolution}")
+            # Orchestrate the debate for every factor; debates are independent, so they
+            # run concurrently (bounded) and the step waits once rather than once per factor
+            debate_slots = asyncio.Semaphore(max(1, MAX_CONCURRENT_DEBATES))
+            await asyncio.gather(*(
+                self._debate_factor(factor, input_text, show_updates, debate_slots) for factor in factors
+            ))
             
             if show_updates:
                 self._notify_progress("debate", "All debates completed")
@@ -172,11 +185,8 @@ class Orchestrator:
             
             # Get validation results from factor extraction
             validation_results = None
-            factor_list_msg = next(
-                (msg for msg in self.message_bus.get_all_messages() 
-                 if msg.get('type') == MessageType.FACTOR_LIST.value),
-                None
-            )
+            factor_list_msgs = self.message_bus.get_messages_by_type(MessageType.FACTOR_LIST)
+            factor_list_msg = factor_list_msgs[0] if factor_list_msgs else None
             if factor_list_msg:
                 validation_results = factor_list_msg.get('validation_results')
             
@@ -230,38 +240,25 @@ class Orchestrator:
                 "all_messages": self.message_bus.get_all_messages()
             }
     
-    async def _wait_for_debate_completion(self, factors: list, show_updates: bool, timeout: float = 60.0):
-        """Wait for debate to complete - all factors have support and critique."""
-        start_time = asyncio.get_event_loop().time()
-        
-        while True:
-            # Check if all factors have support and critique
-            all_complete = True
-            for factor in factors:
-                factor_id = factor['id']
-                supports = self.message_bus.get_messages_by_type(
-                    MessageType.SUPPORT_ARGUMENT
-                )
-                critiques = self.message_bus.get_messages_by_type(
-                    MessageType.CRITIQUE
-                )
-                
-                has_support = any(s.get('factor_id') == factor_id for s in supports)
-                has_critique = any(c.get('factor_id') == factor_id for c in critiques)
-                
-                if not (has_support and has_critique):
-                    all_complete = False
-                    break
+    async def _debate_factor(self, factor: Dict, input_text: str, show_updates: bool,
+                             debate_slots: asyncio.Semaphore):
+        """Run the support -> critique -> rebuttal chain for a single factor."""
+        async with debate_slots:
+            factor_id = factor['id']
             
-            if all_complete:
-                break
+            if show_updates:
+                self._notify_progress("debate", f"Debating factor {factor_id}: {factor['name']}")
             
-            # Check timeout
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                if show_updates:
-                    self._notify_progress("debate", "Debate timeout reached, proceeding...")
-                break
+            # Step 2a: Supporting agent generates support
+            support = await self.support_agent.support_factor(factor, input_text)
             
-            # Wait a bit before checking again
-            await asyncio.sleep(0.5)
-
+            # Step 2b: Critic agent generates critique
+            critique = await self.critic_agent.critique_factor(factor, support, input_text)
+            
+            # Step 2c: Supporting agent may issue rebuttal
+            if critique and critique.get('resolution') != 'ACCEPTED':
+                await self.support_agent.rebut(factor_id, critique, input_text)
+                
+                if show_updates:
+                    resolution = critique.get('resolution', 'UNKNOWN')
+                    self._notify_progress("debate", f"Factor {factor_id} resolved: {resolution}")
@@ -3,48 +3,282 @@ History Storage - Save analysis history (key points only)
 """
 
 import sqlite3
-import json
+import os
+import orjson
+import asyncio
+import itertools
+import zlib
+import logging
+import threading
+from contextlib import contextmanager
+from queue import SimpleQueue, Empty
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Background writer batching: flush after this many queued analyses or this many seconds
+WRITE_BATCH_SIZE = 200
+WRITE_BATCH_WINDOW = 0.05
+# Max analyses waiting for the writer; a full queue pushes back on producers
+WRITE_QUEUE_MAXSIZE = int(os.getenv("HISTORY_WRITE_QUEUE_MAXSIZE", "10000"))
+
+# journal_mode=WAL persists in the database file; the rest are per-connection settings
+_JOURNAL_PRAGMAS = "PRAGMA journal_mode=WAL; PRAGMA wal_autocheckpoint=1000;"
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; "
+    "PRAGMA mmap_size=268435456; PRAGMA cache_size=-65536;"
+)
+
+_CREATE_ANALYSES_SQL = """
+    CREATE TABLE IF NOT EXISTS analyses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        input_preview TEXT,
+        factors_count INTEGER,
+        final_report TEXT,
+        key_points TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        final_report_z BLOB,
+        key_points_json BLOB
+    )
+"""
+
+# Databases created before final_report_z existed get the column added on startup;
+# compressed reports that were written into the TEXT column are moved across
+_SELECT_COLUMNS_SQL = "PRAGMA table_info(analyses)"
+_ADD_REPORT_BLOB_COLUMN_SQL = "ALTER TABLE analyses ADD COLUMN final_report_z BLOB"
+_MOVE_COMPRESSED_REPORTS_SQL = """
+    UPDATE analyses SET final_report_z = final_report, final_report = NULL
+    WHERE typeof(final_report) = 'blob'
+"""
+
+# Key points are orjson bytes in key_points_json; databases created before it existed get the
+# column added on startup, with every stored key_points value (TEXT or bytes) moved across
+_ADD_KEY_POINTS_BLOB_COLUMN_SQL = "ALTER TABLE analyses ADD COLUMN key_points_json BLOB"
+_MOVE_KEY_POINTS_SQL = """
+    UPDATE analyses SET key_points_json = CAST(key_points AS BLOB), key_points = NULL
+    WHERE key_points IS NOT NULL
+"""
+
+# Serves get_history's ORDER BY created_at DESC LIMIT ? as an index scan instead of a full sort
+_CREATE_CREATED_AT_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_analyses_created_at ON analyses(created_at)"
+
+_INSERT_ANALYSIS_SQL = """
+    INSERT INTO analyses (id, timestamp, input_preview, factors_count, final_report_z, key_points_json)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_MAX_ID_SQL = "SELECT MAX(id) FROM analyses"
+
+_SELECT_HISTORY_SQL = """
+    SELECT id, timestamp, input_preview, factors_count, key_points_json AS key_points, created_at
+    FROM analyses
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+_SELECT_ANALYSIS_SQL = """
+    SELECT id, timestamp, input_preview, factors_count, final_report, final_report_z,
+           key_points_json AS key_points, created_at
+    FROM analyses
+    WHERE id = ?
+"""
+
+# Key points are serialized once per row with orjson and stored as bytes (read back without decoding)
+_dumps = orjson.dumps
+_loads = orjson.loads
+
+# Final reports are stored as zlib-compressed UTF-8 in final_report_z; legacy rows hold
+# plain TEXT in final_report
+REPORT_COMPRESSION_LEVEL = 6
+
+
+def _compress_report(report: str) -> bytes:
+    """Compress a final report for storage."""
+    return zlib.compress(report.encode(), REPORT_COMPRESSION_LEVEL)
+
+
+def _decompress_report(stored: bytes) -> str:
+    """Decode a compressed final report."""
+    return zlib.decompress(stored).decode()
+
 
 class HistoryStorage:
     """Stores analysis history with key points only."""
     
     def __init__(self, db_path: str = "aether_history.db"):
         self.db_path = db_path
-        self._init_db()
-    
-    def _init_db(self):
-        """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS analyses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                input_preview TEXT,
-                factors_count INTEGER,
-                final_report TEXT,
-                key_points TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        # Long-lived connections: one writer (serialized by a lock) and a pool of idle readers
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._read_pool: SimpleQueue = SimpleQueue()
         
-        conn.commit()
-        conn.close()
+        # IDs are handed out in-process so callers can learn the ID before the write lands
+        self._next_id = itertools.count(self._init_db() + 1)
+        
+        # Queued (analysis_id, result) pairs drained by a single background writer
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection PRAGMAs applied."""
+        # Connections are shared across worker threads, one user at a time
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+    
+    @contextmanager
+    def _writer(self):
+        """Use the shared writer connection (opened on first use)."""
+        with self._write_lock:
+            if self._write_conn is None:
+                self._write_conn = self._connect()
+            yield self._write_conn
+    
+    @contextmanager
+    def _reader(self):
+        """Borrow an idle reader connection, opening one if none is free."""
+        try:
+            conn = self._read_pool.get_nowait()
+        except Empty:
+            conn = self._connect()
+            # Rows are addressed by column name rather than position
+            conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def _init_db(self) -> int:
+        """Initialize database schema and return the highest analysis ID currently stored."""
+        with self._writer() as conn:
+            cursor = conn.cursor()
+            
+            # WAL: commits skip the rollback-journal fsyncs and readers don't block the writer
+            cursor.executescript(_JOURNAL_PRAGMAS)
+            
+            cursor.execute(_CREATE_ANALYSES_SQL)
+            cursor.execute(_CREATE_CREATED_AT_INDEX_SQL)
+            
+            columns = {row[1] for row in cursor.execute(_SELECT_COLUMNS_SQL)}
+            if "final_report_z" not in columns:
+                cursor.execute(_ADD_REPORT_BLOB_COLUMN_SQL)
+                cursor.execute(_MOVE_COMPRESSED_REPORTS_SQL)
+            if "key_points_json" not in columns:
+                cursor.execute(_ADD_KEY_POINTS_BLOB_COLUMN_SQL)
+                cursor.execute(_MOVE_KEY_POINTS_SQL)
+            
+            conn.commit()
+            
+            # Read the ID seed on the same connection instead of opening a reader for it
+            row = cursor.execute(_SELECT_MAX_ID_SQL).fetchone()
+        return row[0] or 0
     
-    def save_analysis(self, result: Dict) -> int:
+    def reserve_id(self) -> int:
+        """Reserve an analysis ID up front; the row can be written later."""
+        return next(self._next_id)
+    
+    async def save_analysis_async(self, analysis_id: int, result: Dict) -> int:
+        """Save analysis under a reserved ID, returning once its batch has committed."""
+        committed = asyncio.get_running_loop().create_future()
+        # Waits for room in the queue when the writer is behind (back-pressure)
+        await self._get_write_queue().put((analysis_id, result, committed))
+        self._check_queue_depth()
+        await committed
+        return analysis_id
+    
+    def enqueue_analysis(self, analysis_id: int, result: Dict):
+        """
+        Queue an analysis for the background writer, which commits queued rows in batches.
+        Raises asyncio.QueueFull if the writer has fallen WRITE_QUEUE_MAXSIZE rows behind.
+        """
+        self._get_write_queue().put_nowait((analysis_id, result, None))
+        self._check_queue_depth()
+    
+    def _get_write_queue(self) -> asyncio.Queue:
+        """Get the bounded write queue, starting the background writer on first use."""
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+        return self._write_queue
+    
+    def _check_queue_depth(self):
+        """Warn when the write queue is more than 75% full."""
+        depth = self._write_queue.qsize()
+        if depth * 4 > WRITE_QUEUE_MAXSIZE * 3:
+            logger.warning("History write queue at %d/%d", depth, WRITE_QUEUE_MAXSIZE)
+    
+    async def _writer_loop(self):
+        """Drain the write queue, flushing on batch size or time window, one transaction per batch."""
+        loop = asyncio.get_running_loop()
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + WRITE_BATCH_WINDOW
+            while len(batch) < WRITE_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._commit_batch(batch)
+            finally:
+                # Mark the batch processed even on cancellation so flush() can't hang
+                for _ in batch:
+                    queue.task_done()
+    
+    async def flush(self):
+        """Wait until every queued analysis has been written (or has failed)."""
+        if self._write_queue is not None:
+            await self._write_queue.join()
+    
+    async def _commit_batch(self, batch: List[Tuple[int, Dict, Optional[asyncio.Future]]]):
+        """Group commit: one transaction for the whole batch, then wake every waiter."""
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+        except Exception as e:
+            if len(batch) > 1:
+                # Isolate the failing row so it doesn't take the rest of the batch down with it
+                for item in batch:
+                    await self._commit_batch([item])
+                return
+            analysis_id, _, committed = batch[0]
+            if committed is None:
+                logger.error("Failed to save analysis %s to history: %r", analysis_id, e)
+            elif not committed.done():
+                committed.set_exception(e)
+            return
+        for _, _, committed in batch:
+            if committed is not None and not committed.done():
+                committed.set_result(None)
+    
+    def _write_batch(self, batch: List[Tuple[int, Dict, Optional[asyncio.Future]]]):
+        """Insert a batch of analyses with a single executemany/commit."""
+        rows = [self._build_row(result, analysis_id) for analysis_id, result, _ in batch]
+        with self._writer() as conn, conn:
+            conn.executemany(_INSERT_ANALYSIS_SQL, rows)
+    
+    def save_analysis(self, result: Dict, analysis_id: Optional[int] = None) -> int:
         """Save analysis with key points extracted."""
+        if analysis_id is None:
+            analysis_id = self.reserve_id()
         
+        self._write_batch([(analysis_id, result, None)])
+        
+        return analysis_id
+    
+    def _build_row(self, result: Dict, analysis_id: int) -> tuple:
+        """Build the analyses row for a result."""
         # Extract key points
         key_points = self._extract_key_points(result)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Get input preview
         input_preview = ""
         if 'all_messages' in result:
@@ -57,22 +291,14 @@ class HistoryStorage:
         factors_count = len(result.get('factors', []))
         final_report = result.get('final_report', {}).get('report', '')
         
-        cursor.execute("""
-            INSERT INTO analyses (timestamp, input_preview, factors_count, final_report, key_points)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
+        return (
+            analysis_id,
             datetime.utcnow().isoformat(),
             input_preview[:200],
             factors_count,
-            final_report[:5000],  # Limit size
-            json.dumps(key_points)
-        ))
-        
-        analysis_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return analysis_id
+            _compress_report(final_report[:5000]),  # Limit size
+            _dumps(key_points)  # BLOB column: no decode here, and orjson reads bytes back directly
+        )
     
     def _extract_key_points(self, result: Dict) -> List[str]:
         """Extract key points from analysis result."""
@@ -98,58 +324,47 @@ class HistoryStorage:
         
         return key_points[:10]  # Limit to 10 key points
     
+    async def get_history_async(self, limit: int = 50) -> List[Dict]:
+        """Get analysis history in a worker thread (off the event loop)."""
+        return await asyncio.to_thread(self.get_history, limit)
+    
+    async def get_analysis_async(self, analysis_id: int) -> Optional[Dict]:
+        """Get a specific analysis in a worker thread (off the event loop)."""
+        return await asyncio.to_thread(self.get_analysis, analysis_id)
+    
     def get_history(self, limit: int = 50) -> List[Dict]:
         """Get analysis history."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT id, timestamp, input_preview, factors_count, key_points, created_at
-            FROM analyses
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        history = []
-        for row in rows:
-            history.append({
-                "id": row[0],
-                "timestamp": row[1],
-                "input_preview": row[2],
-                "factors_count": row[3],
-                "key_points": json.loads(row[4]) if row[4] else [],
-                "created_at": row[5]
-            })
-        
-        return history
+        return list(self.iter_history(limit))
+    
+    def iter_history(self, limit: int = 50) -> Iterator[Dict]:
+        """Yield analysis history entries one at a time straight off the cursor (no fetchall)."""
+        with self._reader() as conn:
+            for row in conn.execute(_SELECT_HISTORY_SQL, (limit,)):
+                yield self._row_to_dict(row)
     
     def get_analysis(self, analysis_id: int) -> Optional[Dict]:
         """Get a specific analysis by ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT id, timestamp, input_preview, factors_count, final_report, key_points, created_at
-            FROM analyses
-            WHERE id = ?
-        """, (analysis_id,))
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SELECT_ANALYSIS_SQL, (analysis_id,))
+            
+            row = cursor.fetchone()
         
         if not row:
             return None
         
-        return {
-            "id": row[0],
-            "timestamp": row[1],
-            "input_preview": row[2],
-            "factors_count": row[3],
-            "final_report": row[4],
-            "key_points": json.loads(row[5]) if row[5] else [],
-            "created_at": row[6]
-        }
+        return self._row_to_dict(row)
+    
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        """Convert a named row (in SELECT column order) to a dict, decoding key points."""
+        entry = dict(row)
+        key_points = entry["key_points"]
+        entry["key_points"] = _loads(key_points) if key_points else []
+        if "final_report_z" in entry:
+            compressed = entry.pop("final_report_z")
+            if compressed is not None:
+                entry["final_report"] = _decompress_report(compressed)
+        return entry
 